@@ -1,2 +1,9 @@
 # aw-watcher-enhanced
 # Enhanced ActivityWatch watcher with OCR, document context, and categorization
+
+import os
+
+# For Tesseract: its OpenMP threading costs more than it saves on a single
+# screenshot. Tesseract reads this when it is loaded, so it is set here,
+# before any submodule (and .ocr) is imported.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
@@ -10,8 +10,30 @@ Automatically categorizes activities based on:
 
 import logging
 import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import urlparse
+
+# Optional: YAML rules and clients files
+try:
+    import yaml
+
+    YAML_AVAILABLE = True
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+except ImportError:
+    YAML_AVAILABLE = False
+
+# Optional: Aho-Corasick automaton for client keyword matching
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +41,163 @@ logger = logging.getLogger(__name__)
 _rules_cache: Optional[List[Dict[str, Any]]] = None
 _clients_cache: Optional[Dict[str, Any]] = None
 
+# Shared default for missing dict fields; never modified
+_EMPTY: Dict[str, Any] = {}
+
+# Parsed YAML files by path, with the (mtime_ns, size) they were read at. Kept
+# across clear_caches(), so reloading an unchanged file doesn't parse it again.
+_yaml_file_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+# A compiled rule is (category, ((field, pattern), ...)); pattern is None if invalid
+CompiledRule = Tuple[Optional[str], Tuple[Tuple[str, Optional[Pattern[str]]], ...]]
+
+# Patterns with numbered backreferences or conditionals can't be safely
+# joined into an alternation, since other patterns' groups renumber them
+_UNSAFE_TO_COMBINE = re.compile(r"\\[1-9]|\(\?\(")
+
+# One bit per event field, for masks of the fields a rule needs non-empty.
+# Fields outside these are never filled in, so they're always empty.
+_FIELD_BITS = {"app": 1, "title": 2, "url": 4, "domain": 8}
+_OTHER_FIELD_BIT = 16
+
+
+class CompiledRuleSet:
+    """
+    A rule list compiled for matching.
+
+    Besides each rule's own patterns, every field gets a single combined
+    regex ``(?:pat0)|(?:pat1)|...`` over all rules that test it. One search
+    of it tells us whether any rule can match that field at all, so events
+    that match nothing on a field skip all of that field's rules at once.
+
+    Each rule also gets a bitmask of the fields it needs to be non-empty
+    (those whose pattern can't match an empty string), so rules testing
+    fields the event doesn't have are skipped without running any regex.
+    """
+
+    def __init__(self, rules: List[Dict[str, Any]]):
+        self.rules: List[CompiledRule] = _compile_rules(rules)
+        self.field_patterns: Dict[str, Pattern[str]] = _combine_field_patterns(self.rules)
+        self.required_masks: List[int] = [
+            _required_fields_mask(conditions) for _, conditions in self.rules
+        ]
+
+    def first_match(self, values: Dict[str, str]) -> int:
+        """Return the index of the first rule matching the (lowercased) field values, or -1."""
+        # Whether any rule can match each field, filled in on first use
+        can_match: Dict[str, bool] = {}
+        missing_mask = 0
+        for field, bit in _FIELD_BITS.items():
+            if not values.get(field):
+                missing_mask |= bit
+        missing_mask |= _OTHER_FIELD_BIT
+
+        for index, (_, conditions) in enumerate(self.rules):
+            if self.required_masks[index] & missing_mask:
+                continue
+            for field, pattern in conditions:
+                if pattern is None:
+                    break
+                value = values.get(field, "")
+                field_ok = can_match.get(field)
+                if field_ok is None:
+                    field_ok = can_match[field] = self.field_can_match(field, value)
+                if not field_ok or not pattern.search(value):
+                    break
+            else:
+                return index
+
+        return -1
+
+    def field_can_match(self, field: str, value: str) -> bool:
+        """Whether any rule's pattern for a field can match its (lowercased) value."""
+        combined = self.field_patterns.get(field)
+        return combined is None or combined.search(value) is not None
+
+
+# Cache of compiled rule sets, keyed by id() of the source list
+_compiled_rules_cache: Dict[int, Tuple[List[Dict[str, Any]], CompiledRuleSet]] = {}
+_COMPILED_RULES_CACHE_MAX = 32
+
+# Cache of base + custom rule lists compiled as one set, keyed by id() of both
+_effective_rules_cache: Dict[
+    Tuple[int, int], Tuple[List[Dict[str, Any]], List[Dict[str, Any]], CompiledRuleSet]
+] = {}
+
+# A client keyword is (token, keyword, client, project, kind): token is the
+# lowercased keyword, kind is used for logging
+ClientKeyword = Tuple[str, str, str, Optional[str], str]
+
+
+class ClientMatcher:
+    """
+    Client keywords, lowercased once and ranked for matching.
+
+    Keywords are ranked in the order ``_detect_client_and_project`` checks
+    them (projects, then per-client domains/repos/JIRA/emails/keywords, then
+    config keywords), and the first one contained in the text wins.
+
+    With pyahocorasick installed they're also compiled into one automaton:
+    a single pass over the searchable text finds every keyword present and
+    the lowest-ranked hit wins, which gives the same result as checking each
+    keyword with ``in`` one after another.
+    """
+
+    def __init__(self, keywords: List[ClientKeyword]):
+        self.keywords = keywords
+        self.automaton = None
+        # Rank of an empty keyword, which is contained in any text
+        self.always_rank: Optional[int] = None
+
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for rank, (token, _, _, _, _) in enumerate(keywords):
+                if not token:
+                    if self.always_rank is None:
+                        self.always_rank = rank
+                elif token not in automaton:
+                    automaton.add_word(token, rank)
+            if len(automaton):
+                automaton.make_automaton()
+                self.automaton = automaton
+
+    def find(self, searchable: str) -> Optional[ClientKeyword]:
+        """Return the highest-priority keyword contained in the (lowercased) text."""
+        if not AHOCORASICK_AVAILABLE:
+            for entry in self.keywords:
+                if entry[0] in searchable:
+                    return entry
+            return None
+
+        best = self.always_rank
+        if self.automaton is not None:
+            for _, rank in self.automaton.iter(searchable):
+                if best is None or rank < best:
+                    best = rank
+                    if rank == 0:
+                        break
+        return self.keywords[best] if best is not None else None
+
+
+# Cache of client matchers, keyed by id() of the yaml and config client dicts
+_client_matcher_cache: Dict[
+    Tuple[int, int], Tuple[Dict[str, Any], Dict[str, Any], ClientMatcher]
+] = {}
+_CLIENT_MATCHER_CACHE_MAX = 32
+
+
+# Cache of categorize_event results, keyed by (app, title, url, domain). Only
+# events without OCR keywords or document context are cached, since those
+# four fields are then all that categorization looks at. It's cleared when a
+# different config is passed and every _RESULT_CACHE_TTL seconds, so RAG
+# data reloads are picked up.
+ResultKey = Tuple[str, str, str, str]
+_result_cache: "OrderedDict[ResultKey, Optional[str]]" = OrderedDict()
+_RESULT_CACHE_MAX = 4096
+_RESULT_CACHE_TTL = 300.0
+_result_cache_config: Optional[Dict[str, Any]] = None
+_result_cache_expires = 0.0
+
 
 # Default categorization rules
 # Format: list of {match: {...}, category: "..."}
@@ -130,6 +309,120 @@ DEFAULT_RULES: List[Dict[str, Any]] = [
 ]
 
 
+def _compile_pattern(pattern: str) -> Pattern[str]:
+    """
+    Compile a rule pattern for matching against lowercased values.
+
+    Patterns without uppercase characters can skip re.IGNORECASE, which
+    keeps sre's fast literal-prefix scan enabled.
+    """
+    flags = 0 if pattern == pattern.lower() else re.IGNORECASE
+    return re.compile(pattern, flags)
+
+
+def _compile_rules(rules: List[Dict[str, Any]]) -> List[CompiledRule]:
+    """Compile the regex patterns of a rule list once, ahead of matching."""
+    compiled = []
+    for rule in rules:
+        conditions = []
+        for field, pattern in rule.get("match", {}).items():
+            try:
+                conditions.append((field, _compile_pattern(pattern)))
+            except (re.error, TypeError, AttributeError) as e:
+                logger.warning(f"Invalid rule pattern '{pattern}': {e}")
+                conditions.append((field, None))
+        compiled.append((rule.get("category"), tuple(conditions)))
+    return compiled
+
+
+def _required_fields_mask(conditions: Tuple[Tuple[str, Optional[Pattern[str]]], ...]) -> int:
+    """Bitmask of the fields a rule's patterns can only match when non-empty."""
+    mask = 0
+    for field, pattern in conditions:
+        if pattern is not None and pattern.search("") is None:
+            mask |= _FIELD_BITS.get(field, _OTHER_FIELD_BIT)
+    return mask
+
+
+def _combine_field_patterns(rules: List[CompiledRule]) -> Dict[str, Pattern[str]]:
+    """Build one alternation regex per field, used to rule out a field in one search."""
+    alternatives: Dict[str, List[str]] = {}
+    flags: Dict[str, int] = {}
+    unsafe = set()
+    for _, conditions in rules:
+        for field, pattern in conditions:
+            if pattern is None:
+                continue
+            if _UNSAFE_TO_COMBINE.search(pattern.pattern):
+                unsafe.add(field)
+            alternatives.setdefault(field, []).append(f"(?:{pattern.pattern})")
+            flags[field] = flags.get(field, 0) | (pattern.flags & re.IGNORECASE)
+
+    combined = {}
+    for field, parts in alternatives.items():
+        if field in unsafe:
+            continue
+        try:
+            combined[field] = re.compile("|".join(parts), flags[field])
+        except re.error as e:
+            # E.g. clashing group names or inline global flags; match rule by rule
+            logger.debug(f"Cannot combine '{field}' rule patterns: {e}")
+    return combined
+
+
+def _get_compiled_rules(rules: List[Dict[str, Any]]) -> CompiledRuleSet:
+    """Get the compiled form of a rule list, compiling it on first use."""
+    cached = _compiled_rules_cache.get(id(rules))
+    if cached is not None and cached[0] is rules:
+        return cached[1]
+
+    compiled = CompiledRuleSet(rules)
+    if len(_compiled_rules_cache) >= _COMPILED_RULES_CACHE_MAX:
+        _compiled_rules_cache.clear()
+    # Keep a reference to the source list so its id() can't be reused
+    _compiled_rules_cache[id(rules)] = (rules, compiled)
+    return compiled
+
+
+def _get_effective_rules(
+    base_rules: List[Dict[str, Any]], custom_rules: List[Dict[str, Any]]
+) -> CompiledRuleSet:
+    """Get base rules followed by custom rules as one compiled rule set."""
+    if not custom_rules:
+        return _get_compiled_rules(base_rules)
+
+    key = (id(base_rules), id(custom_rules))
+    cached = _effective_rules_cache.get(key)
+    if cached is not None and cached[0] is base_rules and cached[1] is custom_rules:
+        return cached[2]
+
+    compiled = CompiledRuleSet(base_rules + custom_rules)
+    if len(_effective_rules_cache) >= _COMPILED_RULES_CACHE_MAX:
+        _effective_rules_cache.clear()
+    _effective_rules_cache[key] = (base_rules, custom_rules, compiled)
+    return compiled
+
+
+def _warmup():
+    """Compile the default rules ahead of the first event."""
+    _get_compiled_rules(DEFAULT_RULES)
+
+
+def _read_yaml(path: Path) -> Any:
+    """Parse a YAML file, reusing the last parse if the file hasn't changed."""
+    st = path.stat()
+    stat_key = (st.st_mtime_ns, st.st_size)
+    cached = _yaml_file_cache.get(str(path))
+    if cached is not None and cached[0] == stat_key:
+        return cached[1]
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+
+    _yaml_file_cache[str(path)] = (stat_key, data)
+    return data
+
+
 def load_rules_from_yaml(rules_path: Optional[Path] = None) -> List[Dict[str, Any]]:
     """
     Load categorization rules from YAML file.
@@ -160,19 +453,17 @@ def load_rules_from_yaml(rules_path: Optional[Path] = None) -> List[Dict[str, An
         logger.debug("No custom rules file found, using defaults")
         return []
 
-    try:
-        import yaml
+    if not YAML_AVAILABLE:
+        logger.warning("PyYAML not installed, cannot load custom rules")
+        return []
 
-        with open(rules_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+    try:
+        data = _read_yaml(rules_path)
 
         rules = data.get("rules", [])
         logger.info(f"Loaded {len(rules)} rules from {rules_path}")
         _rules_cache = rules
         return rules
-    except ImportError:
-        logger.warning("PyYAML not installed, cannot load custom rules")
-        return []
     except Exception as e:
         logger.error(f"Error loading rules from {rules_path}: {e}")
         return []
@@ -204,26 +495,29 @@ def load_clients_from_yaml(clients_path: Optional[Path] = None) -> Dict[str, Any
                 clients_path = p
                 break
 
+    # With no usable file the empty result is cached too, so later events
+    # skip the path checks until clear_caches()
     if clients_path is None or not clients_path.exists():
         logger.debug("No clients file found")
-        return {}
+        _clients_cache = _EMPTY
+        return _EMPTY
 
-    try:
-        import yaml
+    if not YAML_AVAILABLE:
+        logger.warning("PyYAML not installed, cannot load client keywords")
+        _clients_cache = _EMPTY
+        return _EMPTY
 
-        with open(clients_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+    try:
+        data = _read_yaml(clients_path)
 
         clients = data.get("clients", {})
         logger.info(f"Loaded {len(clients)} clients from {clients_path}")
         _clients_cache = clients
         return clients
-    except ImportError:
-        logger.warning("PyYAML not installed, cannot load client keywords")
-        return {}
     except Exception as e:
         logger.error(f"Error loading clients from {clients_path}: {e}")
-        return {}
+        _clients_cache = _EMPTY
+        return _EMPTY
 
 
 def categorize_event(data: Dict[str, Any], config: Dict[str, Any]) -> Optional[str]:
@@ -240,50 +534,65 @@ def categorize_event(data: Dict[str, Any], config: Dict[str, Any]) -> Optional[s
     if not config.get("enabled", True):
         return None
 
-    # Load rules from YAML if available, then fall back to defaults
+    if data.get("ocr_keywords") or data.get("document"):
+        return _categorize_event(data, config)
+
+    key = (data.get("app", ""), data.get("title", ""), data.get("url", ""), data.get("domain", ""))
+    cache = _get_result_cache(config)
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+
+    category = _categorize_event(data, config)
+    cache[key] = category
+    if len(cache) > _RESULT_CACHE_MAX:
+        cache.popitem(last=False)
+    return category
+
+
+def _get_result_cache(config: Dict[str, Any]) -> "OrderedDict[ResultKey, Optional[str]]":
+    """Get the result cache for this config, clearing it if stale."""
+    global _result_cache_config, _result_cache_expires
+    now = time.monotonic()
+    if config is not _result_cache_config or now >= _result_cache_expires:
+        _result_cache.clear()
+        # Holding the config keeps its identity from being reused
+        _result_cache_config = config
+        _result_cache_expires = now + _RESULT_CACHE_TTL
+    return _result_cache
+
+
+def _categorize_event(data: Dict[str, Any], config: Dict[str, Any]) -> Optional[str]:
+    """Categorize an event, without the result cache."""
+    # Load rules from YAML if available, then fall back to defaults,
+    # followed by any inline custom rules from config
     yaml_rules = load_rules_from_yaml(config.get("rules_file"))
-    rules = yaml_rules if yaml_rules else DEFAULT_RULES.copy()
-
-    # Add any inline custom rules from config
-    custom_rules = config.get("rules", [])
-    rules.extend(custom_rules)
+    rule_set = _get_effective_rules(
+        yaml_rules if yaml_rules else DEFAULT_RULES, config.get("rules", [])
+    )
 
     # Try rule-based categorization first
-    category = _match_rules(data, rules)
+    category = _match_compiled_rules(data, rule_set)
     if category:
         return category
 
+    # Text searched for client names, lowercased once for both detectors
+    rag_text, client_text = _client_search_texts(data)
+
     # Try RAG database for client detection first (most accurate)
     if config.get("use_rag", True):
         qdrant_config = config.get("qdrant", {})
-        client_code, project_code = _detect_client_from_rag(data, qdrant_config)
+        client_code, project_code = _detect_client_from_rag(data, qdrant_config, rag_text)
         if client_code:
             if project_code:
                 return f"Work/Client/{client_code}/{project_code}"
             return f"Work/Client/{client_code}"
 
-    # Fall back to keyword-based client detection
-    # First load from YAML, then merge with config
+    # Fall back to keyword-based client detection (YAML clients, then config)
     yaml_clients = load_clients_from_yaml(config.get("clients_file"))
-    client_keywords = config.get("client_keywords", {})
+    client_keywords = config.get("client_keywords") or _EMPTY
 
-    # Merge YAML clients with config clients
-    all_clients = {}
-    for client_name, client_config in yaml_clients.items():
-        keywords = client_config.get("keywords", [])
-        # Also add domains and emails as keywords
-        keywords.extend(client_config.get("domains", []))
-        keywords.extend(client_config.get("emails", []))
-        all_clients[client_name] = keywords
-
-    # Config client_keywords override/extend
-    for client_name, keywords in client_keywords.items():
-        if client_name in all_clients:
-            all_clients[client_name].extend(keywords)
-        else:
-            all_clients[client_name] = keywords
-
-    client, project = _detect_client_and_project(data, yaml_clients, client_keywords)
+    client, project = _detect_client_and_project(data, yaml_clients, client_keywords, client_text)
     if client:
         if project:
             return f"Work/Client/{client}/{project}"
@@ -295,35 +604,21 @@ def categorize_event(data: Dict[str, Any], config: Dict[str, Any]) -> Optional[s
 
 def _match_rules(data: Dict[str, Any], rules: List[Dict[str, Any]]) -> Optional[str]:
     """Match event against categorization rules."""
-    app = data.get("app", "").lower()
-    title = data.get("title", "").lower()
-    url = data.get("url", "").lower()
+    return _match_compiled_rules(data, _get_compiled_rules(rules))
 
-    for rule in rules:
-        match_conditions = rule.get("match", {})
-        all_match = True
-
-        for field, pattern in match_conditions.items():
-            value = ""
-            if field == "app":
-                value = app
-            elif field == "title":
-                value = title
-            elif field == "url":
-                value = url
-            elif field == "domain":
-                value = data.get("domain", "").lower()
 
-            try:
-                if not re.search(pattern, value, re.IGNORECASE):
-                    all_match = False
-                    break
-            except re.error:
-                all_match = False
-                break
+def _match_compiled_rules(data: Dict[str, Any], rule_set: CompiledRuleSet) -> Optional[str]:
+    """Match event against a compiled rule set."""
+    values = {
+        "app": data.get("app", "").lower(),
+        "title": data.get("title", "").lower(),
+        "url": data.get("url", "").lower(),
+        "domain": data.get("domain", "").lower(),
+    }
 
-        if all_match:
-            return rule.get("category")
+    index = rule_set.first_match(values)
+    if index >= 0:
+        return rule_set.rules[index][0]
 
     return None
 
@@ -334,28 +629,32 @@ def _detect_client(data: Dict[str, Any], client_keywords: Dict[str, List[str]])
         return None
 
     # Collect all searchable text
+    document = data.get("document") or _EMPTY
     searchable = " ".join(
         [
             data.get("title", ""),
             data.get("url", ""),
             " ".join(data.get("ocr_keywords", [])),
-            data.get("document", {}).get("project", ""),
-            data.get("document", {}).get("filename", ""),
+            document.get("project", ""),
+            document.get("filename", ""),
         ]
     ).lower()
 
     # Check each client's keywords
-    for client, keywords in client_keywords.items():
-        for keyword in keywords:
-            if keyword.lower() in searchable:
-                logger.debug(f"Detected client '{client}' via keyword '{keyword}'")
-                return client
+    match = _get_client_matcher(_EMPTY, client_keywords).find(searchable)
+    if match:
+        _, keyword, client, _, _ = match
+        logger.debug(f"Detected client '{client}' via keyword '{keyword}'")
+        return client
 
     return None
 
 
 def _detect_client_and_project(
-    data: Dict[str, Any], yaml_clients: Dict[str, Any], config_keywords: Dict[str, List[str]]
+    data: Dict[str, Any],
+    yaml_clients: Dict[str, Any],
+    config_keywords: Dict[str, List[str]],
+    searchable: Optional[str] = None,
 ) -> tuple:
     """
     Detect client and optionally project from keywords.
@@ -364,125 +663,170 @@ def _detect_client_and_project(
         data: Event data dict
         yaml_clients: Client configs loaded from YAML (with projects)
         config_keywords: Simple client keywords from config
+        searchable: Lowercased text to search, if already built by the caller
 
     Returns:
         Tuple of (client_name, project_name) or (None, None)
     """
-    # Collect all searchable text
-    searchable = " ".join(
+    if searchable is None:
+        searchable = _client_search_texts(data)[1]
+
+    match = _get_client_matcher(yaml_clients, config_keywords).find(searchable)
+    if not match:
+        return None, None
+
+    _, keyword, client_name, project_name, kind = match
+    if project_name:
+        logger.debug(
+            f"Detected client '{client_name}' project '{project_name}' via keyword '{keyword}'"
+        )
+    else:
+        logger.debug(f"Detected client '{client_name}' via {kind} '{keyword}'")
+    return client_name, project_name
+
+
+def _client_search_texts(data: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Build the lowercased text client detection searches.
+
+    Returns:
+        Tuple of (RAG text, keyword text). The RAG text joins the non-empty
+        title, OCR keywords and document project/filename; the keyword text
+        joins all of those plus the URL and domain.
+    """
+    document = data.get("document") or _EMPTY
+    title = data.get("title", "").lower()
+    ocr_text = " ".join(data.get("ocr_keywords", [])).lower()
+    project = document.get("project", "").lower()
+    filename = document.get("filename", "").lower()
+
+    rag_text = " ".join(filter(None, [title, ocr_text, project, filename]))
+    keyword_text = " ".join(
         [
-            data.get("title", ""),
-            data.get("url", ""),
-            " ".join(data.get("ocr_keywords", [])),
-            data.get("document", {}).get("project", ""),
-            data.get("document", {}).get("filename", ""),
-            data.get("domain", ""),
+            title,
+            data.get("url", "").lower(),
+            ocr_text,
+            project,
+            filename,
+            data.get("domain", "").lower(),
         ]
-    ).lower()
+    )
+    return rag_text, keyword_text
 
-    # First, try to match projects within clients (more specific)
+
+def _client_keywords(
+    yaml_clients: Dict[str, Any], config_keywords: Dict[str, List[str]]
+) -> List[ClientKeyword]:
+    """List client keywords, lowercased, in the order they should be checked."""
+    keywords: List[ClientKeyword] = []
+
+    # Projects within clients (more specific)
     for client_name, client_config in yaml_clients.items():
         if not isinstance(client_config, dict):
             continue
-
-        projects = client_config.get("projects", {})
-        for project_name, project_keywords in projects.items():
+        for project_name, project_keywords in client_config.get("projects", {}).items():
             if not isinstance(project_keywords, list):
                 continue
             for keyword in project_keywords:
-                if keyword.lower() in searchable:
-                    logger.debug(
-                        f"Detected client '{client_name}' project '{project_name}' via keyword '{keyword}'"
-                    )
-                    return client_name, project_name
+                keywords.append((keyword.lower(), keyword, client_name, project_name, "keyword"))
 
-    # Then try client-level keywords
+    # Client-level domains, repos, JIRA projects, emails and keywords
     for client_name, client_config in yaml_clients.items():
         if isinstance(client_config, dict):
-            keywords = client_config.get("keywords", [])
-            # Also check domains
-            for domain in client_config.get("domains", []):
-                if domain.lower() in searchable:
-                    logger.debug(f"Detected client '{client_name}' via domain '{domain}'")
-                    return client_name, None
-            # Check github repos
-            for repo in client_config.get("github_repos", []):
-                if repo.lower() in searchable:
-                    logger.debug(f"Detected client '{client_name}' via repo '{repo}'")
-                    return client_name, None
-            # Check jira projects
-            for jira_proj in client_config.get("jira_projects", []):
-                if jira_proj.lower() in searchable:
-                    logger.debug(f"Detected client '{client_name}' via JIRA '{jira_proj}'")
-                    return client_name, None
-            # Check emails
-            for email in client_config.get("emails", []):
-                if email.lower() in searchable:
-                    logger.debug(f"Detected client '{client_name}' via email '{email}'")
-                    return client_name, None
+            for key, kind in (
+                ("domains", "domain"),
+                ("github_repos", "repo"),
+                ("jira_projects", "JIRA"),
+                ("emails", "email"),
+            ):
+                for keyword in client_config.get(key, []):
+                    keywords.append((keyword.lower(), keyword, client_name, None, kind))
+            client_keywords = client_config.get("keywords", [])
         else:
-            keywords = client_config if isinstance(client_config, list) else []
+            client_keywords = client_config if isinstance(client_config, list) else []
+        for keyword in client_keywords:
+            keywords.append((keyword.lower(), keyword, client_name, None, "keyword"))
 
-        for keyword in keywords:
-            if keyword.lower() in searchable:
-                logger.debug(f"Detected client '{client_name}' via keyword '{keyword}'")
-                return client_name, None
-
-    # Finally try simple config keywords
-    for client_name, keywords in config_keywords.items():
-        if not isinstance(keywords, list):
+    # Simple config keywords
+    for client_name, config_client_keywords in config_keywords.items():
+        if not isinstance(config_client_keywords, list):
             continue
-        for keyword in keywords:
-            if keyword.lower() in searchable:
-                logger.debug(f"Detected client '{client_name}' via config keyword '{keyword}'")
-                return client_name, None
+        for keyword in config_client_keywords:
+            keywords.append((keyword.lower(), keyword, client_name, None, "config keyword"))
 
-    return None, None
+    return keywords
+
+
+def _get_client_matcher(
+    yaml_clients: Dict[str, Any], config_keywords: Dict[str, List[str]]
+) -> ClientMatcher:
+    """Get the client matcher for these client dicts, building it on first use."""
+    key = (id(yaml_clients), id(config_keywords))
+    cached = _client_matcher_cache.get(key)
+    # Holding the dicts keeps their ids from being reused while cached
+    if cached is not None and cached[0] is yaml_clients and cached[1] is config_keywords:
+        return cached[2]
+
+    if len(_client_matcher_cache) >= _CLIENT_MATCHER_CACHE_MAX:
+        _client_matcher_cache.clear()
+    matcher = ClientMatcher(_client_keywords(yaml_clients, config_keywords))
+    _client_matcher_cache[key] = (yaml_clients, config_keywords, matcher)
+    return matcher
 
 
 def clear_caches():
-    """Clear the rules and clients caches. Useful for testing or config reload."""
-    global _rules_cache, _clients_cache
+    """Clear the rules, clients and result caches. Useful for testing or config reload."""
+    global _rules_cache, _clients_cache, _result_cache_config
     _rules_cache = None
     _clients_cache = None
+    _result_cache.clear()
+    _result_cache_config = None
+    _compiled_rules_cache.clear()
+    _effective_rules_cache.clear()
+    _client_matcher_cache.clear()
+    _get_rag_client.cache_clear()
 
 
-def _detect_client_from_rag(data: Dict[str, Any], qdrant_config: Optional[Dict] = None) -> tuple:
+@lru_cache(maxsize=8)
+def _get_rag_client(host: str, port: int):
+    """Get the RAG client for a Qdrant server, or None if it isn't available."""
+    try:
+        from .rag_client import get_rag_client
+    except ImportError:
+        logger.debug("RAG client not available")
+        return None
+
+    return get_rag_client(qdrant_host=host, qdrant_port=port)
+
+
+def _detect_client_from_rag(
+    data: Dict[str, Any], qdrant_config: Optional[Dict] = None, searchable: Optional[str] = None
+) -> tuple:
     """
     Detect client using the RAG database (Qdrant).
 
     Args:
         data: Event data dict
         qdrant_config: Optional Qdrant configuration dict with host, port, etc.
+        searchable: Lowercased text to search, if already built by the caller
 
     Returns:
         Tuple of (client_code, project_code) or (None, None)
     """
-    try:
-        from .rag_client import get_rag_client
-    except ImportError:
-        logger.debug("RAG client not available")
-        return None, None
-
     # Get config values or use defaults
-    if qdrant_config:
-        host = qdrant_config.get("host", "localhost")
-        port = qdrant_config.get("port", 6333)
-        rag = get_rag_client(qdrant_host=host, qdrant_port=port)
-    else:
-        rag = get_rag_client()
+    qdrant_config = qdrant_config or {}
+    rag = _get_rag_client(qdrant_config.get("host", "localhost"), qdrant_config.get("port", 6333))
+    if rag is None:
+        return None, None
 
     # Try domain detection first (most reliable)
-    url = data.get("url", "")
     domain = data.get("domain", "")
+    url = data.get("url", "")
 
-    if url:
+    # Only parse the URL when the event doesn't already carry its domain
+    if not domain and url:
         try:
-            from urllib.parse import urlparse
-
-            parsed = urlparse(url)
-            if parsed.netloc:
-                domain = parsed.netloc
+            domain = urlparse(url).netloc
         except Exception:
             pass
 
@@ -495,13 +839,8 @@ def _detect_client_from_rag(data: Dict[str, Any], qdrant_config: Optional[Dict]
             return client_code, project_code
 
     # Try text-based detection from title and OCR keywords
-    searchable_parts = [
-        data.get("title", ""),
-        " ".join(data.get("ocr_keywords", [])),
-        data.get("document", {}).get("project", ""),
-        data.get("document", {}).get("filename", ""),
-    ]
-    searchable = " ".join(filter(None, searchable_parts))
+    if searchable is None:
+        searchable = _client_search_texts(data)[0]
 
     if searchable:
         result = rag.detect_client_from_text(searchable)
@@ -523,13 +862,7 @@ def get_category_hierarchy(category: str) -> List[str]:
         return []
 
     parts = category.split("/")
-    hierarchy = []
-    current = ""
-    for part in parts:
-        current = f"{current}/{part}" if current else part
-        hierarchy.append(current)
-
-    return hierarchy
+    return ["/".join(parts[:i]) for i in range(1, len(parts) + 1)]
 
 
 def suggest_category(data: Dict[str, Any]) -> List[str]:
@@ -539,23 +872,34 @@ def suggest_category(data: Dict[str, Any]) -> List[str]:
     Returns a list of suggested categories ordered by likelihood.
     """
     suggestions = []
+    rule_set = _get_compiled_rules(DEFAULT_RULES)
+
+    # Lowercased field values, or None for fields no rule can match
+    values: Dict[str, Optional[str]] = {}
 
     # Try all rules and collect matches
-    for rule in DEFAULT_RULES:
-        match_conditions = rule.get("match", {})
+    for category, conditions in rule_set.rules:
         score = 0
 
-        for field, pattern in match_conditions.items():
-            value = data.get(field, "")
-            if isinstance(value, str):
-                try:
-                    if re.search(pattern, value, re.IGNORECASE):
-                        score += 1
-                except re.error:
-                    pass
+        for field, pattern in conditions:
+            if pattern is None:
+                continue
+            if field in values:
+                value = values[field]
+            else:
+                value = data.get(field, "")
+                if isinstance(value, str):
+                    value = value.lower()
+                    if not rule_set.field_can_match(field, value):
+                        value = None
+                else:
+                    value = None
+                values[field] = value
+            if value is not None and pattern.search(value):
+                score += 1
 
         if score > 0:
-            suggestions.append((score, rule.get("category")))
+            suggestions.append((score, category))
 
     # Sort by score descending
     suggestions.sort(key=lambda x: -x[0])
@@ -573,6 +917,8 @@ def suggest_category(data: Dict[str, Any]) -> List[str]:
 
 # Test module
 if __name__ == "__main__":
+    _warmup()
+
     test_cases = [
         {"app": "Code.exe", "title": "main.py - my-project"},
         {"app": "chrome.exe", "url": "https://github.com/user/repo/pull/123"},
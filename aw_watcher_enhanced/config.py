@@ -2,10 +2,23 @@
 Configuration management for aw-watcher-enhanced.
 """
 
+import copy
 import logging
 import os
+import pickle
+import re
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Pattern
+
+# Optional: YAML config file
+try:
+    import yaml
+
+    YAML_AVAILABLE = True
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+except ImportError:
+    YAML_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +41,11 @@ DEFAULT_CONFIG: Dict[str, Any] = {
             "similarity_threshold": 0.85,  # 0-1, higher = more similar required to skip
             "min_change_chars": 50,  # minimum char diff to trigger LLM
         },
+        # Screen change detection - skip OCR when the screenshot hasn't changed
+        "screen_hash": {
+            "enabled": True,
+            "max_distance": 5,  # max differing bits of the 64-bit image hash to skip
+        },
         # Remote desktop - force frequent OCR since internal window changes aren't detectable
         "remote_desktop_interval": 10.0,  # OCR every 10s when in remote desktop
         "remote_desktop_apps": [
@@ -49,16 +67,23 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     },
     "ocr": {
         "enabled": True,
+        "background": True,  # run OCR/LLM on a worker thread instead of the poll loop
         "trigger": "smart",  # "window_change", "periodic", "both", or "smart"
         "periodic_interval": 30,  # seconds between OCR when same window
         "engine": "auto",  # "auto", "apple_vision", "windows", "rapidocr", "tesseract"
         "extract_mode": "keywords",  # "keywords", "entities", "full_text"
         "max_keywords": 20,
+        "capture_region": "window",  # "window" (active window) or "monitor" (under cursor)
+        "max_width": 1600,  # downscale wider captures before OCR (0 = never)
+        "grayscale": True,  # convert captures to grayscale once before OCR
+        "tesseract_oem": 1,  # Tesseract engine mode: 1 = LSTM only (fastest)
+        "tessdata_dir": None,  # e.g. a tessdata_fast checkout for faster Tesseract models
     },
     "llm": {
-        "model": "gemma3:4b",
+        "model": "gemma3:4b-it-q4_K_M",
         "timeout": 10.0,
         "enabled": True,
+        "persistent_cache": True,  # Reuse LLM results for screens seen before
     },
     "browser": {
         "enabled": False,  # Requires browser extension
@@ -96,6 +121,9 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     },
 }
 
+# Pickled DEFAULT_CONFIG, unpickled for a fresh deep copy (faster than copy.deepcopy)
+_DEFAULT_CONFIG_BYTES = pickle.dumps(DEFAULT_CONFIG, protocol=pickle.HIGHEST_PROTOCOL)
+
 
 def get_config_dir() -> Path:
     """Get the configuration directory for aw-watcher-enhanced."""
@@ -119,45 +147,93 @@ def load_config() -> Dict[str, Any]:
     config_dir = get_config_dir()
     config_file = config_dir / "config.yaml"
 
-    config = DEFAULT_CONFIG.copy()
+    config = pickle.loads(_DEFAULT_CONFIG_BYTES)
 
-    if config_file.exists():
+    if not YAML_AVAILABLE:
+        if config_file.exists():
+            logger.warning("PyYAML not installed, using default config")
+    elif config_file.exists():
         try:
-            import yaml
-
             with open(config_file, "r") as f:
-                user_config = yaml.safe_load(f)
+                user_config = yaml.load(f, Loader=_YAML_LOADER)
 
             if user_config:
                 # Deep merge user config into defaults
-                config = deep_merge(config, user_config)
+                _deep_merge_inplace(config, user_config)
                 logger.info(f"Loaded config from {config_file}")
-        except ImportError:
-            logger.warning("PyYAML not installed, using default config")
         except Exception as e:
             logger.error(f"Error loading config: {e}")
     else:
         # Create default config file
         try:
-            import yaml
-
             with open(config_file, "w") as f:
                 yaml.dump(DEFAULT_CONFIG, f, default_flow_style=False)
             logger.info(f"Created default config at {config_file}")
-        except ImportError:
-            pass
         except Exception as e:
             logger.warning(f"Could not create default config: {e}")
 
+    compile_privacy_patterns(config)
     return config
 
 
+def compile_pattern_union(
+    patterns: List[str], flags: int = re.IGNORECASE
+) -> Optional[Pattern[str]]:
+    """
+    Compile a list of regex patterns into one pattern matching any of them.
+
+    Invalid patterns are logged and dropped. Returns None if there are no
+    valid patterns, or if they can't be combined (numbered backreferences
+    and conditionals would refer to the wrong group once joined), in which
+    case callers should test the patterns one by one.
+    """
+    valid = []
+    for pattern in patterns:
+        try:
+            re.compile(pattern, flags)
+        except (re.error, TypeError) as e:
+            logger.warning(f"Invalid pattern '{pattern}': {e}")
+            continue
+        if re.search(r"\\[1-9]|\(\?\(", pattern):
+            return None
+        valid.append(pattern)
+
+    if not valid:
+        return None
+
+    try:
+        return re.compile("|".join(f"(?:{p})" for p in valid), flags)
+    except re.error as e:
+        logger.warning(f"Could not combine patterns: {e}")
+        return None
+
+
+def compile_privacy_patterns(config: Dict[str, Any]) -> None:
+    """
+    Add combined exclude patterns to a config's privacy section.
+
+    Sets ``_exclude_titles_re``, ``_exclude_urls_re`` and ``_redact_re`` (see
+    compile_pattern_union) so privacy filters can do one search per field.
+    """
+    privacy = dict(config.get("privacy", {}))
+    privacy["_exclude_titles_re"] = compile_pattern_union(privacy.get("exclude_titles", []))
+    privacy["_exclude_urls_re"] = compile_pattern_union(privacy.get("exclude_urls", []))
+    privacy["_redact_re"] = compile_pattern_union(privacy.get("redact_patterns", []))
+    # Replace rather than update the section, in case it is shared with another config
+    config["privacy"] = privacy
+
+
 def deep_merge(base: dict, override: dict) -> dict:
     """Deep merge two dictionaries."""
-    result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
+    result = copy.deepcopy(base)
+    _deep_merge_inplace(result, override)
     return result
+
+
+def _deep_merge_inplace(dst: dict, src: dict) -> None:
+    """Deep merge src into dst, modifying dst."""
+    for key, value in src.items():
+        if key in dst and isinstance(dst[key], dict) and isinstance(value, dict):
+            _deep_merge_inplace(dst[key], value)
+        else:
+            dst[key] = value
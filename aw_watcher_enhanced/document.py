@@ -10,13 +10,27 @@ Parses window titles to extract:
 
 import logging
 import re
-from typing import Any, Dict, Optional
+import subprocess
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Pattern, Tuple, Union
+
+# Optional: Aho-Corasick automaton for app name matching
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 
 # Patterns for extracting document info from window titles
 # Format: app_pattern -> {title_regex, field_mappings}
+# A title pattern of {"capture_all": group} takes the whole title as that group,
+# without running a regex
 TITLE_PATTERNS: Dict[str, Dict[str, Any]] = {
     # Visual Studio Code
     r"Code\.exe|code|Visual Studio Code": {
@@ -80,7 +94,7 @@ TITLE_PATTERNS: Dict[str, Dict[str, Any]] = {
     r"vim|nvim|gvim": {
         "patterns": [
             r"^(?P<file>.+?)\s+[-–]\s+N?VIM$",
-            r"^(?P<file>.+?)$",  # Often just the filename
+            {"capture_all": "file"},  # Often just the filename
         ],
         "type": "code",
     },
@@ -94,7 +108,7 @@ TITLE_PATTERNS: Dict[str, Dict[str, Any]] = {
     # File Explorer / Finder
     r"explorer\.exe|Finder": {
         "patterns": [
-            r"^(?P<path>.+)$",  # Usually shows the folder path
+            {"capture_all": "path"},  # Usually shows the folder path
         ],
         "type": "file_browser",
     },
@@ -148,6 +162,98 @@ FILE_EXTENSIONS = {
     "data": [".json", ".xml", ".yaml", ".yml", ".toml", ".ini", ".cfg"],
 }
 
+# A compiled title pattern, or the group name of a capture_all pattern
+TitlePattern = Union[Pattern[str], str]
+
+
+class PatternEntry(NamedTuple):
+    """A compiled TITLE_PATTERNS entry."""
+
+    app_re: Pattern[str]
+    title_patterns: Tuple[TitlePattern, ...]
+    doc_type: str
+
+
+# TITLE_PATTERNS is the authoring format; parsing only uses these compiled entries
+_COMPILED_TITLE_PATTERNS: Tuple[PatternEntry, ...] = tuple(
+    PatternEntry(
+        re.compile(app_pattern, re.IGNORECASE),
+        tuple(
+            (
+                pattern["capture_all"]
+                if isinstance(pattern, dict)
+                else re.compile(pattern, re.IGNORECASE)
+            )
+            for pattern in config["patterns"]
+        ),
+        config["type"],
+    )
+    for app_pattern, config in TITLE_PATTERNS.items()
+)
+
+# All app patterns as one alternation; the "app<i>" group that matched gives the
+# index into _COMPILED_TITLE_PATTERNS
+_APP_DISPATCH = re.compile(
+    "|".join(f"(?P<app{i}>{pattern})" for i, pattern in enumerate(TITLE_PATTERNS)),
+    re.IGNORECASE,
+)
+
+# _APP_DISPATCH_BEFORE[i] matches any app pattern listed before pattern i
+_APP_DISPATCH_BEFORE: List[Optional[Pattern[str]]] = [None] + [
+    re.compile("|".join(f"(?:{pattern})" for pattern in list(TITLE_PATTERNS)[:i]), re.IGNORECASE)
+    for i in range(1, len(TITLE_PATTERNS))
+]
+
+# An app pattern alternative made only of plain or escaped punctuation characters
+_LITERAL_ALTERNATIVE = re.compile(r"(?:[^\\.^$*+?{}\[\]|()]|\\[^A-Za-z0-9])+")
+
+
+def _literal_app_tokens() -> Optional[List[Tuple[str, int]]]:
+    """
+    Lowercased literal alternatives of the app patterns, as (token, pattern index).
+
+    Returns None if any app pattern is more than literal alternatives, in
+    which case apps are matched with _APP_DISPATCH instead.
+    """
+    tokens = []
+    for index, app_pattern in enumerate(TITLE_PATTERNS):
+        for alternative in app_pattern.split("|"):
+            if not _LITERAL_ALTERNATIVE.fullmatch(alternative):
+                return None
+            tokens.append((re.sub(r"\\(.)", r"\1", alternative).lower(), index))
+    return tokens
+
+
+# App patterns are plain words, so apps are found by substring search on the
+# lowercased name: one automaton pass if pyahocorasick is installed, else a scan
+_APP_TOKENS = _literal_app_tokens()
+_APP_AUTOMATON = None
+if _APP_TOKENS is not None and AHOCORASICK_AVAILABLE:
+    _APP_AUTOMATON = ahocorasick.Automaton()
+    for _token, _index in _APP_TOKENS:
+        if _token not in _APP_AUTOMATON:
+            _APP_AUTOMATON.add_word(_token, _index)
+    _APP_AUTOMATON.make_automaton()
+
+# Git info per repository root, with the time.monotonic() it was read at
+_git_info_cache: Dict[str, Tuple[float, Dict[str, str]]] = {}
+_GIT_INFO_TTL = 60.0  # seconds; branches change rarely
+
+# FILE_EXTENSIONS flattened to extension -> file type
+_EXTENSION_TYPES: Dict[str, str] = {
+    ext: file_type for file_type, extensions in FILE_EXTENSIONS.items() for ext in extensions
+}
+
+# Common project root indicators, for _extract_project_from_path
+_PROJECT_ROOT_PATTERNS: List[Pattern[str]] = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"[/\\](?:Projects?|Code|repos?|src|dev|workspace|work)[/\\]([^/\\]+)",
+        r"[/\\]github[/\\]([^/\\]+)",
+        r"[/\\]([^/\\]+)[/\\](?:src|lib|app)[/\\]",
+    )
+]
+
 
 def parse_document_context(app: str, title: str) -> Optional[Dict[str, Any]]:
     """
@@ -163,40 +269,53 @@ def parse_document_context(app: str, title: str) -> Optional[Dict[str, Any]]:
     if not app or not title:
         return None
 
+    # Titles repeat from one poll to the next, so parses are cached; callers
+    # get their own copy of the result
+    items = _parse_document_context(app, title)
+    return dict(items) if items else None
+
+
+@lru_cache(maxsize=4096)
+def _parse_document_context(app: str, title: str) -> Tuple[Tuple[str, Any], ...]:
+    """Parse document context, returned as (key, value) pairs for caching."""
     result: Dict[str, Any] = {}
 
     # Find matching app pattern
-    for app_pattern, config in TITLE_PATTERNS.items():
-        if re.search(app_pattern, app, re.IGNORECASE):
-            # Try each title pattern
-            for pattern in config["patterns"]:
-                match = re.match(pattern, title, re.IGNORECASE)
-                if match:
-                    groups = match.groupdict()
-
-                    # Add matched fields
-                    if groups.get("file"):
-                        result["filename"] = groups["file"].strip()
-                    if groups.get("project"):
-                        result["project"] = groups["project"].strip()
-                    if groups.get("path"):
-                        result["path"] = groups["path"].strip()
-                    if groups.get("page_title"):
-                        result["page_title"] = groups["page_title"].strip()
-
-                    result["type"] = config["type"]
-                    break
-            break
+    app_index = _find_app_pattern(app)
+    if app_index is not None:
+        entry = _COMPILED_TITLE_PATTERNS[app_index]
+        # Try each title pattern
+        for pattern in entry.title_patterns:
+            if isinstance(pattern, str):
+                groups = _capture_all(pattern, title)
+            else:
+                match = pattern.match(title)
+                groups = match.groupdict() if match else None
+            if groups is not None:
+
+                # Add matched fields
+                if groups.get("file"):
+                    result["filename"] = groups["file"].strip()
+                if groups.get("project"):
+                    result["project"] = groups["project"].strip()
+                if groups.get("path"):
+                    result["path"] = groups["path"].strip()
+                if groups.get("page_title"):
+                    result["page_title"] = groups["page_title"].strip()
+
+                result["type"] = entry.doc_type
+                break
 
     # Try to detect file type from extension
     if result.get("filename"):
         filename = result["filename"]
-        for file_type, extensions in FILE_EXTENSIONS.items():
-            for ext in extensions:
-                if filename.lower().endswith(ext):
-                    result["file_type"] = file_type
-                    result["extension"] = ext
-                    break
+        dot = filename.rfind(".")
+        if dot >= 0:
+            ext = filename[dot:].lower()
+            file_type = _EXTENSION_TYPES.get(ext)
+            if file_type:
+                result["file_type"] = file_type
+                result["extension"] = ext
 
     # Try to extract project from path if not already set
     if result.get("path") and not result.get("project"):
@@ -204,9 +323,49 @@ def parse_document_context(app: str, title: str) -> Optional[Dict[str, Any]]:
         if project:
             result["project"] = project
 
-    return result if result else None
+    return tuple(result.items())
+
+
+def _capture_all(group: str, title: str) -> Optional[Dict[str, str]]:
+    """Match a title against a capture_all pattern, like re.match(f"^(?P<{group}>.+)$")."""
+    # "$" also matches before a trailing newline, and "." never matches one
+    line = title[:-1] if title.endswith("\n") else title
+    if not line or "\n" in line:
+        return None
+    return {group: line}
+
+
+# Only a handful of distinct app names are ever seen, while titles change
+# constantly, so the app lookup is memoized separately from the title parse
+@lru_cache(maxsize=256)
+def _find_app_pattern(app: str) -> Optional[int]:
+    """Index of the first TITLE_PATTERNS app pattern found in the app name, or None."""
+    if _APP_TOKENS is not None:
+        app_lower = app.lower()
+        if _APP_AUTOMATON is not None:
+            return min((index for _, index in _APP_AUTOMATON.iter(app_lower)), default=None)
+        for token, index in _APP_TOKENS:
+            if token in app_lower:
+                return index
+        return None
+
+    match = _APP_DISPATCH.search(app)
+    if not match:
+        return None
+
+    index = int(match.lastgroup[3:])
+    # The alternation returns the leftmost match, but a pattern listed earlier
+    # that matches further along the name takes priority
+    before = _APP_DISPATCH_BEFORE[index]
+    if before is not None and before.search(app, match.start() + 1):
+        index = next(
+            i for i, entry in enumerate(_COMPILED_TITLE_PATTERNS) if entry.app_re.search(app)
+        )
 
+    return index
 
+
+@lru_cache(maxsize=1024)
 def _extract_project_from_path(path: str) -> Optional[str]:
     """
     Try to extract project name from a file path.
@@ -216,15 +375,8 @@ def _extract_project_from_path(path: str) -> Optional[str]:
     - C:\\Users\\user\\Code\\project-name\\...
     - /home/user/repos/project-name/...
     """
-    # Common project root indicators
-    project_roots = [
-        r"[/\\](?:Projects?|Code|repos?|src|dev|workspace|work)[/\\]([^/\\]+)",
-        r"[/\\]github[/\\]([^/\\]+)",
-        r"[/\\]([^/\\]+)[/\\](?:src|lib|app)[/\\]",
-    ]
-
-    for pattern in project_roots:
-        match = re.search(pattern, path, re.IGNORECASE)
+    for pattern in _PROJECT_ROOT_PATTERNS:
+        match = pattern.search(path)
         if match:
             return match.group(1)
 
@@ -237,61 +389,118 @@ def extract_git_info(path: str) -> Optional[Dict[str, str]]:
 
     Returns dict with 'repo', 'branch', 'remote' if in a git repo.
     """
-    import subprocess
-    from pathlib import Path
-
     try:
-        # Find .git directory
-        p = Path(path)
-        while p.parent != p:
-            if (p / ".git").exists():
-                break
-            p = p.parent
-        else:
+        git_root = _find_git_root(path)
+        if git_root is None:
             return None
 
-        git_dir = p
-        result = {}
+        # Every file in a repository shares its info, so it's cached per root
+        now = time.monotonic()
+        cached = _git_info_cache.get(git_root)
+        if cached is None or now - cached[0] >= _GIT_INFO_TTL:
+            cached = (now, _read_git_info(Path(git_root)))
+            _git_info_cache[git_root] = cached
+
+        return dict(cached[1])
 
-        # Get repo name
-        result["repo"] = git_dir.name
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _find_git_root(path: str) -> Optional[str]:
+    """Find the directory containing the .git of the repository a path is in."""
+    p = Path(path)
+    while p.parent != p:
+        if (p / ".git").exists():
+            return str(p)
+        p = p.parent
+    return None
 
-        # Get current branch
+
+def _read_git_info(git_dir: Path) -> Dict[str, str]:
+    """Read repo name, current branch and origin remote of a repository root."""
+    result = {}
+
+    # Get repo name
+    result["repo"] = git_dir.name
+
+    # Read branch and remote from the .git directory itself; worktrees and
+    # submodules have a .git file pointing elsewhere, so ask git for those
+    dot_git = git_dir / ".git"
+    if dot_git.is_dir():
         try:
-            branch = (
-                subprocess.check_output(
-                    ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-                    cwd=str(git_dir),
-                    stderr=subprocess.DEVNULL,
-                    timeout=1,
-                )
-                .decode()
-                .strip()
-            )
-            result["branch"] = branch
+            head = (dot_git / "HEAD").read_text(encoding="utf-8").strip()
+            if head.startswith("ref:"):
+                ref = head[4:].strip()
+                result["branch"] = ref[11:] if ref.startswith("refs/heads/") else ref
+            else:
+                # Detached HEAD, reported like git rev-parse --abbrev-ref
+                result["branch"] = "HEAD"
         except Exception:
             pass
 
-        # Get remote URL
         try:
-            remote = (
-                subprocess.check_output(
-                    ["git", "remote", "get-url", "origin"],
-                    cwd=str(git_dir),
-                    stderr=subprocess.DEVNULL,
-                    timeout=1,
-                )
-                .decode()
-                .strip()
-            )
-            result["remote"] = remote
+            remote = _read_origin_url(dot_git / "config")
+            if remote:
+                result["remote"] = remote
         except Exception:
             pass
 
         return result
 
+    # Get current branch
+    try:
+        branch = (
+            subprocess.check_output(
+                ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+                cwd=str(git_dir),
+                stderr=subprocess.DEVNULL,
+                timeout=1,
+            )
+            .decode()
+            .strip()
+        )
+        result["branch"] = branch
     except Exception:
-        return None
+        pass
+
+    # Get remote URL
+    try:
+        remote = (
+            subprocess.check_output(
+                ["git", "remote", "get-url", "origin"],
+                cwd=str(git_dir),
+                stderr=subprocess.DEVNULL,
+                timeout=1,
+            )
+            .decode()
+            .strip()
+        )
+        result["remote"] = remote
+    except Exception:
+        pass
+
+    return result
+
+
+def _read_origin_url(config_path: Path) -> Optional[str]:
+    """Read the first url of the "origin" remote from a git config file."""
+    in_origin = False
+    for line in config_path.read_text(encoding="utf-8", errors="replace").splitlines():
+        line = line.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line.startswith("["):
+            in_origin = line == '[remote "origin"]'
+        elif in_origin:
+            key, _, value = line.partition("=")
+            if key.strip().lower() == "url":
+                value = value.strip()
+                if len(value) >= 2 and value[0] == value[-1] == '"':
+                    value = value[1:-1]
+                return value
+    return None
 
 
 # Test the module
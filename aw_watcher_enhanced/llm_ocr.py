@@ -14,12 +14,29 @@ Supports multiple backends:
 """
 
 import base64
+import hashlib
 import json
 import logging
 import os
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import pybase64
+
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +56,13 @@ LLM_BACKENDS = {
     },
 }
 
+# Backend -> (default API URL, API key environment variable)
+_BACKEND_DEFAULTS: Dict[str, Tuple[str, str]] = {
+    "ollama": ("http://localhost:11434", "OLLAMA_API_KEY"),
+    "claude": ("https://api.anthropic.com", "CLAUDE_API_KEY"),
+    "openai": ("https://api.openai.com", "OPENAI_API_KEY"),
+}
+
 # Fast prompt for screen analysis
 SCREEN_ANALYSIS_PROMPT = """Analyze this screenshot and respond with ONLY a JSON object (no markdown, no explanation):
 
@@ -67,43 +91,103 @@ TEXT_SUMMARIZE_PROMPT = """Extract what the user is working on from screen text.
 Examples:
 
 Text: [TITLE BAR: Project Budget.xlsx] CLIENT: Acme Inc Total: $50,000
-Answer: {{"document": "Project Budget.xlsx", "client": "Acme Inc", "project": null, "keywords": ["budget", "finance"]}}
+Answer: {"document": "Project Budget.xlsx", "client": "Acme Inc", "project": null, "keywords": ["budget", "finance"]}
 
 Text: [TITLE BAR: Resource Planner.xlsx] DAG Tech BILL OF MATERIALS CLIENT: SWTLNE01 Total Labor $24,400
-Answer: {{"document": "Resource Planner.xlsx", "client": "SWTLNE01", "project": null, "keywords": ["resource", "labor", "billing"]}}
+Answer: {"document": "Resource Planner.xlsx", "client": "SWTLNE01", "project": null, "keywords": ["resource", "labor", "billing"]}
 
 Text: [TITLE BAR: Pitch Outline.docx - Word] Client Code: KHHTH01 Project Title: Slack to Microsoft Teams Migration
-Answer: {{"document": "Pitch Outline.docx", "client": "KHHTH01", "project": "Slack to Microsoft Teams Migration", "keywords": ["migration", "slack", "teams"]}}
+Answer: {"document": "Pitch Outline.docx", "client": "KHHTH01", "project": "Slack to Microsoft Teams Migration", "keywords": ["migration", "slack", "teams"]}
 
 Text: [TITLE BAR: main.py - aw-watcher-enhanced - Visual Studio Code] def capture_screen(): import mss git commit -m "Add OCR"
-Answer: {{"document": "main.py", "client": null, "project": "aw-watcher-enhanced", "keywords": ["python", "ocr", "screen capture"]}}
+Answer: {"document": "main.py", "client": null, "project": "aw-watcher-enhanced", "keywords": ["python", "ocr", "screen capture"]}
 
 Text: [TITLE BAR: Terminal - zsh] cd ~/dagtech/acme-portal npm run build Successfully compiled 147 modules
-Answer: {{"document": "Terminal", "client": "Acme", "project": "acme-portal", "keywords": ["build", "npm", "terminal"]}}
+Answer: {"document": "Terminal", "client": "Acme", "project": "acme-portal", "keywords": ["build", "npm", "terminal"]}
 
 Text: [TITLE BAR: PR #42 - dagtech/meridian-migration - GitHub] https://github.com/dagtech/meridian-migration/pull/42 feat: add SSO integration Files changed: 12
-Answer: {{"document": "GitHub PR #42", "client": "Meridian", "project": "meridian-migration", "url": "https://github.com/dagtech/meridian-migration/pull/42", "keywords": ["github", "sso", "pull request"]}}
+Answer: {"document": "GitHub PR #42", "client": "Meridian", "project": "meridian-migration", "url": "https://github.com/dagtech/meridian-migration/pull/42", "keywords": ["github", "sso", "pull request"]}
 
 Text: [TITLE BAR: Jira - ACME-1234] Implement SSO for enterprise customers Status: In Progress Assignee: Greg
-Answer: {{"document": "ACME-1234", "client": "Acme", "project": "SSO Implementation", "keywords": ["jira", "sso", "enterprise"]}}
+Answer: {"document": "ACME-1234", "client": "Acme", "project": "SSO Implementation", "keywords": ["jira", "sso", "enterprise"]}
 
 Text: [TITLE BAR: Slack - Meridian Health] #proj-migration @sarah the data export is ready for review
-Answer: {{"document": "Slack", "client": "Meridian Health", "project": "migration", "keywords": ["slack", "data export", "review"]}}
+Answer: {"document": "Slack", "client": "Meridian Health", "project": "migration", "keywords": ["slack", "data export", "review"]}
 
 Text: [TITLE BAR: AWS Console] EC2 > Instances i-0abc123 nexgen-prod-api running t3.large
-Answer: {{"document": "AWS EC2", "client": "NexGen", "project": "nexgen-prod-api", "keywords": ["aws", "ec2", "infrastructure"]}}
+Answer: {"document": "AWS EC2", "client": "NexGen", "project": "nexgen-prod-api", "keywords": ["aws", "ec2", "infrastructure"]}
 
 Text: [TITLE BAR: Google Workspace | Admin - DAG Tech] https://dagtech.huducloud.com/passwords/google-workspace-admin Companies / RGCENG01 / Passwords / Website - Admin administrator@rgce.com
-Answer: {{"document": "Hudu - Google Workspace Admin", "client": "RGCENG01", "project": "Password Management", "url": "https://dagtech.huducloud.com/passwords/google-workspace-admin", "breadcrumb": "Companies / RGCENG01 / Passwords / Website - Admin", "keywords": ["hudu", "passwords", "google workspace"]}}
+Answer: {"document": "Hudu - Google Workspace Admin", "client": "RGCENG01", "project": "Password Management", "url": "https://dagtech.huducloud.com/passwords/google-workspace-admin", "breadcrumb": "Companies / RGCENG01 / Passwords / Website - Admin", "keywords": ["hudu", "passwords", "google workspace"]}
 
 Text: [TITLE BAR: ConnectWise Manage] Service Ticket #847234 ACME Corp - Server offline Priority: Critical Assigned: Greg
-Answer: {{"document": "Ticket #847234", "client": "ACME Corp", "project": "Server offline", "keywords": ["connectwise", "ticket", "critical"]}}
+Answer: {"document": "Ticket #847234", "client": "ACME Corp", "project": "Server offline", "keywords": ["connectwise", "ticket", "critical"]}
 
 Now extract from:
 {ocr_text}
 
 JSON:"""
 
+# The examples contain literal braces, so the prompt is split around the
+# placeholder once rather than going through str.format on every call
+_PROMPT_PREFIX, _PROMPT_SUFFIX = TEXT_SUMMARIZE_PROMPT.split("{ocr_text}")
+
+
+if ORJSON_AVAILABLE:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# Concurrent LLM requests per analyzer; also the HTTP connection pool size
+_MAX_CONCURRENT_REQUESTS = 4
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _find_json_object(text: str) -> Optional[Any]:
+    """
+    Decode the first JSON object embedded in model output.
+
+    Handles replies like 'Here is the JSON: {...} Hope this helps' in a
+    single pass, moving on to the next '{' when one fails to decode.
+    """
+    start = text.find("{")
+    while start != -1:
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(text, start)
+            return obj
+        except json.JSONDecodeError:
+            start = text.find("{", start + 1)
+    return None
+
+
+def _create_session(headers: Optional[Dict[str, str]] = None):
+    """Create a keep-alive HTTP session for LLM API calls."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_MAX_CONCURRENT_REQUESTS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def _post_json(session, url: str, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+    """POST a JSON payload and return the decoded JSON response."""
+    response = session.post(url, data=_json_dumps(payload), headers=_JSON_HEADERS, timeout=timeout)
+    response.raise_for_status()
+    return _json_loads(response.content)
+
 
 class LLMScreenAnalyzer:
     """Analyzes screen captures using vision LLMs."""
@@ -125,35 +209,67 @@ class LLMScreenAnalyzer:
             api_key: API key for cloud backends
             base_url: Custom API URL (for Ollama, defaults to localhost:11434)
             timeout: Request timeout in seconds
+
+        Raises:
+            ValueError: If the backend is not supported
         """
         self.backend = backend
-        self.model = model or LLM_BACKENDS.get(backend, {}).get("default", "moondream")
-        self.api_key = api_key or os.environ.get(f"{backend.upper()}_API_KEY")
-        self.base_url = base_url
+        self._analyze_fn = {
+            "ollama": self._analyze_ollama,
+            "claude": self._analyze_claude,
+            "openai": self._analyze_openai,
+        }.get(backend)
+        if self._analyze_fn is None:
+            raise ValueError(f"Unknown LLM backend: {backend}")
+
+        default_url, api_key_env = _BACKEND_DEFAULTS[backend]
+        self.model = model or LLM_BACKENDS[backend]["default"]
+        self.api_key = api_key or os.environ.get(api_key_env)
+        self.base_url = base_url or default_url
         self.timeout = timeout
 
-        # Set default URLs
-        if backend == "ollama" and not base_url:
-            self.base_url = "http://localhost:11434"
-        elif backend == "claude" and not base_url:
-            self.base_url = "https://api.anthropic.com"
-        elif backend == "openai" and not base_url:
-            self.base_url = "https://api.openai.com"
+        # Reuse one connection pool so calls skip the TCP/TLS handshake
+        headers = {}
+        if backend == "claude" and self.api_key:
+            headers = {"x-api-key": self.api_key, "anthropic-version": "2023-06-01"}
+        elif backend == "openai" and self.api_key:
+            headers = {"Authorization": f"Bearer {self.api_key}"}
+        self._session = _create_session(headers)
 
         logger.info(f"LLM OCR initialized: {backend}/{self.model}")
 
     def _image_to_base64(self, image) -> str:
         """Convert PIL Image to base64 string."""
+        from PIL import Image
+
         buffer = BytesIO()
-        # Resize for speed if too large
+        # Resize for speed if too large. Bilinear with a reducing gap first
+        # shrinks by an integer factor, which is far cheaper than the default
+        # bicubic for 4K captures and plenty for a low-detail vision model.
         max_size = 1024
         if max(image.size) > max_size:
             ratio = max_size / max(image.size)
             new_size = (int(image.size[0] * ratio), int(image.size[1] * ratio))
-            image = image.resize(new_size)
-
-        image.save(buffer, format="JPEG", quality=85)
-        return base64.b64encode(buffer.getvalue()).decode("utf-8")
+            image = image.resize(new_size, Image.Resampling.BILINEAR, reducing_gap=2.0)
+
+        # JPEG can't store alpha or palette images
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+
+        # 4:2:0 chroma at quality 70 is plenty for low-detail vision models and
+        # encodes faster with a much smaller payload
+        image.save(
+            buffer,
+            format="JPEG",
+            quality=70,
+            subsampling=2,
+            optimize=False,
+            progressive=False,
+        )
+        data = buffer.getvalue()
+        if PYBASE64_AVAILABLE:
+            return pybase64.b64encode_as_string(data)
+        return base64.b64encode(data).decode("ascii")
 
     def analyze(self, image, prompt: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
@@ -170,15 +286,7 @@ class LLMScreenAnalyzer:
         start_time = time.time()
 
         try:
-            if self.backend == "ollama":
-                result = self._analyze_ollama(image, prompt)
-            elif self.backend == "claude":
-                result = self._analyze_claude(image, prompt)
-            elif self.backend == "openai":
-                result = self._analyze_openai(image, prompt)
-            else:
-                logger.error(f"Unknown backend: {self.backend}")
-                return None
+            result = self._analyze_fn(image, prompt)
 
             elapsed = time.time() - start_time
             logger.debug(f"LLM analysis completed in {elapsed:.2f}s")
@@ -189,10 +297,35 @@ class LLMScreenAnalyzer:
             logger.error(f"LLM analysis failed: {e}")
             return None
 
+    def analyze_many(
+        self,
+        images: List[Any],
+        prompt: Optional[str] = None,
+        max_concurrency: int = _MAX_CONCURRENT_REQUESTS,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Analyze several screen captures concurrently (e.g. one per monitor).
+
+        The calls are network-bound, so they overlap on a small thread pool
+        sharing this analyzer's connection pool.
+
+        Args:
+            images: PIL Image objects
+            prompt: Custom prompt (uses default if not provided)
+            max_concurrency: Maximum requests in flight at once
+
+        Returns:
+            Analysis results in the same order as images
+        """
+        if len(images) <= 1 or max_concurrency <= 1:
+            return [self.analyze(image, prompt) for image in images]
+
+        workers = min(max_concurrency, len(images))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda image: self.analyze(image, prompt), images))
+
     def _analyze_ollama(self, image, prompt: str) -> Optional[Dict[str, Any]]:
         """Analyze using Ollama (local)."""
-        import requests
-
         image_b64 = self._image_to_base64(image)
 
         payload = {
@@ -206,22 +339,13 @@ class LLMScreenAnalyzer:
             },
         }
 
-        response = requests.post(
-            f"{self.base_url}/api/generate",
-            json=payload,
-            timeout=self.timeout,
-        )
-        response.raise_for_status()
-
-        result = response.json()
+        result = _post_json(self._session, f"{self.base_url}/api/generate", payload, self.timeout)
         text = result.get("response", "")
 
         return self._parse_json_response(text)
 
     def _analyze_claude(self, image, prompt: str) -> Optional[Dict[str, Any]]:
         """Analyze using Claude API."""
-        import requests
-
         if not self.api_key:
             logger.error("Claude API key not set")
             return None
@@ -249,29 +373,13 @@ class LLMScreenAnalyzer:
             ],
         }
 
-        headers = {
-            "x-api-key": self.api_key,
-            "anthropic-version": "2023-06-01",
-            "content-type": "application/json",
-        }
-
-        response = requests.post(
-            f"{self.base_url}/v1/messages",
-            json=payload,
-            headers=headers,
-            timeout=self.timeout,
-        )
-        response.raise_for_status()
-
-        result = response.json()
+        result = _post_json(self._session, f"{self.base_url}/v1/messages", payload, self.timeout)
         text = result.get("content", [{}])[0].get("text", "")
 
         return self._parse_json_response(text)
 
     def _analyze_openai(self, image, prompt: str) -> Optional[Dict[str, Any]]:
         """Analyze using OpenAI API."""
-        import requests
-
         if not self.api_key:
             logger.error("OpenAI API key not set")
             return None
@@ -298,20 +406,9 @@ class LLMScreenAnalyzer:
             ],
         }
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
-        response = requests.post(
-            f"{self.base_url}/v1/chat/completions",
-            json=payload,
-            headers=headers,
-            timeout=self.timeout,
+        result = _post_json(
+            self._session, f"{self.base_url}/v1/chat/completions", payload, self.timeout
         )
-        response.raise_for_status()
-
-        result = response.json()
         text = result.get("choices", [{}])[0].get("message", {}).get("content", "")
 
         return self._parse_json_response(text)
@@ -330,24 +427,52 @@ class LLMScreenAnalyzer:
             text = "\n".join(lines[1:-1] if lines[-1] == "```" else lines[1:])
 
         try:
-            return json.loads(text)
+            return _json_loads(text)
         except json.JSONDecodeError:
             # Try to find JSON object in text
-            start = text.find("{")
-            end = text.rfind("}") + 1
-            if start >= 0 and end > start:
-                try:
-                    return json.loads(text[start:end])
-                except json.JSONDecodeError:
-                    pass
+            parsed = _find_json_object(text)
+            if parsed is not None:
+                return parsed
 
             logger.warning(f"Failed to parse LLM response as JSON: {text[:100]}")
             return {"raw_text": text}
 
 
+# Shared keep-alive session for text summarization calls
+_summarize_session = None
+
+# LLM summaries keyed by a hash of the model, URL and cleaned OCR text
+_summary_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_SUMMARY_CACHE_MAX = 128
+_SUMMARY_CACHE_TTL = 300.0  # seconds
+
+# Characters of cleaned OCR text sent to the LLM
+_OCR_TEXT_MAX_CHARS = 1500
+
+
+def _prepare_ocr_text(ocr_text: str, max_chars: int = _OCR_TEXT_MAX_CHARS) -> str:
+    """
+    Clean OCR output before sending it to the LLM.
+
+    Drops lines with fewer than 3 alphanumeric characters and repeated lines
+    (toolbars, menus), keeping the first occurrence, then truncates.
+    """
+    lines = []
+    for line in ocr_text.split("\n"):
+        line = line.strip()
+        alnum = 0
+        for char in line:
+            if char.isalnum():
+                alnum += 1
+                if alnum >= 3:
+                    lines.append(line)
+                    break
+    return "\n".join(dict.fromkeys(lines))[:max_chars]
+
+
 def summarize_ocr_with_llm(
     ocr_text: str,
-    model: str = "gemma3:4b",
+    model: str = "gemma3:4b-it-q4_K_M",
     base_url: str = "http://localhost:11434",
     timeout: float = 10.0,
 ) -> Optional[Dict[str, Any]]:
@@ -365,21 +490,33 @@ def summarize_ocr_with_llm(
     Returns:
         Structured dict with app, task, document, client, keywords
     """
-    import requests
+    global _summarize_session
 
     if not ocr_text or len(ocr_text.strip()) < 10:
         return None
 
-    # Truncate OCR text if too long
-    ocr_text = ocr_text[:2000]
+    ocr_text = _prepare_ocr_text(ocr_text)
+    if not ocr_text:
+        return None
+
+    # Unchanged screens skip the LLM round-trip entirely
+    cache_key = hashlib.sha1(f"{model}\0{base_url}\0{ocr_text}".encode()).hexdigest()
+    now = time.monotonic()
+    cached = _summary_cache.get(cache_key)
+    if cached is not None and now - cached[0] < _SUMMARY_CACHE_TTL:
+        _summary_cache.move_to_end(cache_key)
+        return dict(cached[1])
 
-    prompt = TEXT_SUMMARIZE_PROMPT.format(ocr_text=ocr_text)
+    prompt = _PROMPT_PREFIX + ocr_text + _PROMPT_SUFFIX
 
     try:
         start = time.time()
-        response = requests.post(
+        if _summarize_session is None:
+            _summarize_session = _create_session()
+        result = _post_json(
+            _summarize_session,
             f"{base_url}/api/generate",
-            json={
+            {
                 "model": model,
                 "prompt": prompt,
                 "stream": False,
@@ -388,12 +525,10 @@ def summarize_ocr_with_llm(
                     "num_predict": 150,
                 },
             },
-            timeout=timeout,
+            timeout,
         )
-        response.raise_for_status()
 
         elapsed = time.time() - start
-        result = response.json()
         text = result.get("response", "")
 
         logger.debug(f"LLM summarize completed in {elapsed:.2f}s")
@@ -408,19 +543,18 @@ def summarize_ocr_with_llm(
             text = "\n".join(lines[1:-1] if lines[-1].startswith("```") else lines[1:])
 
         try:
-            parsed = json.loads(text)
+            parsed = _json_loads(text)
         except json.JSONDecodeError:
-            start_idx = text.find("{")
-            end_idx = text.rfind("}") + 1
-            if start_idx >= 0 and end_idx > start_idx:
-                try:
-                    parsed = json.loads(text[start_idx:end_idx])
-                except:
-                    parsed = {}
-            else:
-                parsed = {}
-
-        return parsed if parsed else None
+            parsed = _find_json_object(text)
+
+        if not parsed or not isinstance(parsed, dict):
+            return None
+
+        _summary_cache[cache_key] = (now, parsed)
+        _summary_cache.move_to_end(cache_key)
+        if len(_summary_cache) > _SUMMARY_CACHE_MAX:
+            _summary_cache.popitem(last=False)
+        return dict(parsed)
 
     except Exception as e:
         logger.debug(f"LLM summarize failed: {e}")
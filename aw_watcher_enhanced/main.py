@@ -14,25 +14,35 @@ Usage:
 
 import argparse
 import gc
+import hashlib
 import logging
+import re
 import signal
 import sys
+import threading
 from datetime import datetime, timezone
-from time import sleep
+from itertools import chain
+from time import monotonic
 from typing import Optional
 
 from aw_client import ActivityWatchClient
 from aw_core.models import Event
 
 from .categorizer import categorize_event
-from .config import load_config
+from .config import get_config_dir, load_config
 from .document import parse_document_context
 from .privacy import apply_privacy_filters
 from .window import get_current_window
 
 # Try to import OCR module (optional)
 try:
-    from .ocr import OCR_AVAILABLE, capture_and_ocr, capture_screen, ocr_image_structured
+    from .ocr import (
+        OCR_AVAILABLE,
+        capture_and_ocr,
+        capture_for_ocr,
+        extract_text_data,
+        ocr_image_structured,
+    )
 except ImportError:
     OCR_AVAILABLE = False
 
@@ -46,17 +56,62 @@ except ImportError:
 
 # Try to import smart capture (optional)
 try:
-    from .smart_capture import IdleDetector, OCRDiffDetector, SmartCaptureManager
+    from .smart_capture import (
+        CaptureTask,
+        IdleDetector,
+        LLMResultCache,
+        OCRDiffDetector,
+        ProcessingQueue,
+        ScreenChangeDetector,
+        SmartCaptureManager,
+    )
 
     SMART_CAPTURE_AVAILABLE = True
 except ImportError:
     SMART_CAPTURE_AVAILABLE = False
+    LLMResultCache = None
     OCRDiffDetector = None
+    ProcessingQueue = None
+    ScreenChangeDetector = None
 
 logger = logging.getLogger(__name__)
 
 WATCHER_NAME = "aw-watcher-enhanced"
 
+# window_data fields filled in from OCR and LLM results
+_OCR_FIELDS = (
+    "ocr_keywords",
+    "ocr_entities",
+    "barcodes",
+    "llm_document",
+    "llm_client",
+    "llm_project",
+    "llm_url",
+    "llm_breadcrumb",
+    "llm_page",
+)
+
+# LLM result keys and the window_data fields they are merged into
+_LLM_FIELDS = (
+    ("document", "llm_document"),
+    ("client", "llm_client"),
+    ("project", "llm_project"),
+    ("url", "llm_url"),
+    ("breadcrumb", "llm_breadcrumb"),
+    ("page", "llm_page"),
+)
+
+# Placeholder values small models emit instead of leaving a field out
+_INVALID_LLM_VALUES = frozenset({"null", "none", ""})
+
+
+def _is_valid_llm_value(value) -> bool:
+    """Filter out null/None values and prompt echoes from LLM output."""
+    if not value:
+        return False
+    value_str = str(value).strip().lower()
+    return value_str not in _INVALID_LLM_VALUES and "otherwise" not in value_str
+
 
 class EnhancedWatcher:
     """Main watcher class that orchestrates all capture modules."""
@@ -66,6 +121,8 @@ class EnhancedWatcher:
         self.enable_ocr = enable_ocr and OCR_AVAILABLE
         self.enable_llm = enable_llm and LLM_OCR_AVAILABLE
         self.running = False
+        # Set to cut the poll sleep short (stop, or a background OCR result)
+        self._wake = threading.Event()
         self.config = load_config()
 
         # Initialize AW client
@@ -74,15 +131,17 @@ class EnhancedWatcher:
 
         # Track state for change detection
         self.last_window_data = None
-        self.last_ocr_time = None
+        self.last_ocr_time = None  # monotonic() of the last OCR capture
         self.last_ocr_result = None  # Cache last OCR/LLM result
+        self.last_ocr_fields = None  # OCR/LLM fields of the last capture, for unchanged screens
+        self.last_ocr_window = None  # (app, title) the last OCR capture was taken for
 
         # Memory management - run gc.collect() periodically
         self._last_gc_time = None
         self._gc_interval = 300  # Run garbage collection every 5 minutes
 
         # LLM config
-        self.llm_model = self.config.get("llm", {}).get("model", "gemma3:4b")
+        self.llm_model = self.config.get("llm", {}).get("model", "gemma3:4b-it-q4_K_M")
         self.llm_timeout = self.config.get("llm", {}).get("timeout", 10.0)
 
         # Smart capture config
@@ -96,6 +155,14 @@ class EnhancedWatcher:
             self.idle_detector.set_threshold(self.idle_threshold)
             logger.info(f"Idle detection enabled (threshold: {self.idle_threshold}s)")
 
+        # Remote desktop app names as one pattern, checked every tick
+        remote_apps = self.config.get("smart_capture", {}).get("remote_desktop_apps", [])
+        self._remote_app_re = (
+            re.compile("|".join(re.escape(app.lower()) for app in remote_apps))
+            if remote_apps
+            else None
+        )
+
         # Initialize OCR diff detector to skip redundant LLM calls
         self.ocr_diff_detector = None
         if SMART_CAPTURE_AVAILABLE and OCRDiffDetector:
@@ -106,6 +173,47 @@ class EnhancedWatcher:
             )
             logger.info("OCR diff detection enabled (skips LLM for unchanged content)")
 
+        # Initialize screen change detector to skip OCR for unchanged screenshots
+        self.screen_change_detector = None
+        if SMART_CAPTURE_AVAILABLE and ScreenChangeDetector:
+            hash_config = self.config.get("smart_capture", {}).get("screen_hash", {})
+            if hash_config.get("enabled", True):
+                self.screen_change_detector = ScreenChangeDetector(
+                    max_distance=hash_config.get("max_distance", 5),
+                )
+                logger.info("Screen change detection enabled (skips OCR for unchanged screens)")
+
+        # Persist LLM results across restarts, keyed by screen hash and window
+        self.llm_cache = None
+        if (
+            self.enable_llm
+            and self.screen_change_detector is not None
+            and LLMResultCache
+            and self.config.get("llm", {}).get("persistent_cache", True)
+        ):
+            try:
+                self.llm_cache = LLMResultCache(get_config_dir() / "llm_cache.sqlite3")
+                logger.info("Persistent LLM cache enabled")
+            except Exception as e:
+                logger.warning(f"Persistent LLM cache unavailable: {e}")
+
+        # OCR and LLM take seconds, so by default they run on a background
+        # worker and the poll loop keeps its cadence. The queue holds only the
+        # most recent capture.
+        self.ocr_queue = None
+        if (
+            self.enable_ocr
+            and SMART_CAPTURE_AVAILABLE
+            and ProcessingQueue
+            and self.config.get("ocr", {}).get("background", True)
+        ):
+            self.ocr_queue = ProcessingQueue(
+                processor=self._process_ocr_task,
+                max_size=1,
+                on_result=lambda result: self._wake.set(),
+            )
+            logger.info("Background OCR enabled")
+
         logger.info(f"Initialized {WATCHER_NAME}")
         logger.info(f"OCR enabled: {self.enable_ocr}")
         logger.info(f"LLM enhancement enabled: {self.enable_llm}")
@@ -117,8 +225,13 @@ class EnhancedWatcher:
         self.client.create_bucket(self.bucket_id, event_type, queued=True)
         logger.info(f"Created bucket: {self.bucket_id}")
 
-    def capture_state(self) -> Optional[dict]:
-        """Capture current window state with all enhancements."""
+    def capture_state(self, idle_secs: Optional[float] = None) -> Optional[dict]:
+        """
+        Capture current window state with all enhancements.
+
+        Args:
+            idle_secs: Seconds since last user input, if already known this tick
+        """
         # Step 1: Get basic window info
         window_data = get_current_window()
         if not window_data:
@@ -131,116 +244,38 @@ class EnhancedWatcher:
         if document_context:
             window_data["document"] = document_context
 
-        # Step 3: OCR capture (if enabled and triggered)
-        if self.enable_ocr and self._should_capture_ocr(window_data):
-            ocr_config = self.config.get("ocr", {})
-
-            # Use structured OCR to get position-based text extraction
-            image = capture_screen(window_only=False)
-            structured_ocr = None
-            if image:
-                try:
-                    structured_ocr = ocr_image_structured(image)
-                finally:
-                    # Explicitly close and delete image to prevent memory leak
-                    try:
-                        image.close()
-                    except Exception:
-                        pass
-                    del image
-
-            # Also get standard OCR data for keywords/entities
-            ocr_config_with_text = {**ocr_config, "extract_mode": "full_text"}
-            ocr_data = capture_and_ocr(ocr_config_with_text)
-            if ocr_data:
-                window_data["ocr_keywords"] = ocr_data.get("keywords", [])
-                if ocr_data.get("entities"):
-                    window_data["ocr_entities"] = ocr_data["entities"]
-
-                # Add barcode data if detected
-                if structured_ocr and structured_ocr.get("barcodes"):
-                    window_data["barcodes"] = structured_ocr["barcodes"]
-
-                # Step 3b: LLM enhancement of OCR text
-                if self.enable_llm and ocr_data.get("text"):
-                    # Prepare enhanced context for LLM including title bar text
-                    ocr_text = ocr_data["text"]
-                    if structured_ocr and structured_ocr.get("title_bar"):
-                        # Prepend title bar text for better document detection
-                        title_bar_text = structured_ocr["title_bar"]
-                        ocr_text = f"[TITLE BAR: {title_bar_text}]\n\n{ocr_text}"
-
-                    # Check if OCR content changed enough to warrant LLM call
-                    should_run_llm = True
-                    if self.ocr_diff_detector:
-                        should_run_llm, diff_reason = self.ocr_diff_detector.should_run_llm(
-                            ocr_text, window_data
-                        )
-                        if not should_run_llm:
-                            # Reuse cached LLM result if content unchanged
-                            if self.last_ocr_result:
-                                llm_result = self.last_ocr_result
-                                logger.debug(f"Reusing cached LLM result ({diff_reason})")
-                            else:
-                                llm_result = None
-                        else:
-                            llm_result = None  # Will run LLM below
-
-                    if should_run_llm:
-                        llm_result = summarize_ocr_with_llm(
-                            ocr_text,
-                            model=self.llm_model,
-                            timeout=self.llm_timeout,
-                        )
-                        # Cache result for potential reuse
-                        if llm_result:
-                            self.last_ocr_result = llm_result
-                    else:
-                        llm_result = self.last_ocr_result
-                    if llm_result:
-                        # Merge LLM insights into window_data
-                        # Filter out null/None values and prompt echoes
-                        def is_valid(val):
-                            if not val:
-                                return False
-                            val_str = str(val).lower()
-                            return (
-                                val_str not in ("null", "none", "") and "otherwise" not in val_str
-                            )
+        # Excluded apps are dropped below anyway; don't capture their screen
+        privacy_config = self.config.get("privacy", {})
+        if apply_privacy_filters(window_data, privacy_config) is None:
+            return None
 
-                        doc = llm_result.get("document")
-                        if is_valid(doc):
-                            window_data["llm_document"] = doc
-                        client = llm_result.get("client")
-                        if is_valid(client):
-                            window_data["llm_client"] = client
-                        project = llm_result.get("project")
-                        if is_valid(project):
-                            window_data["llm_project"] = project
-                        url = llm_result.get("url")
-                        if is_valid(url):
-                            window_data["llm_url"] = url
-                        breadcrumb = llm_result.get("breadcrumb")
-                        if is_valid(breadcrumb):
-                            window_data["llm_breadcrumb"] = breadcrumb
-                        page = llm_result.get("page")
-                        if is_valid(page):
-                            window_data["llm_page"] = page
-                        if llm_result.get("keywords"):
-                            # Merge LLM keywords with OCR keywords
-                            llm_keywords = llm_result["keywords"]
-                            if isinstance(llm_keywords, list):
-                                llm_keywords = [k for k in llm_keywords if is_valid(k)]
-                                window_data["ocr_keywords"] = list(
-                                    set(window_data.get("ocr_keywords", []) + llm_keywords)
-                                )[:25]
-                        logger.debug(
-                            f"LLM: doc={llm_result.get('document')}, client={llm_result.get('client')}, page={llm_result.get('page')}"
-                        )
-            self.last_ocr_time = datetime.now(timezone.utc)
+        # Step 3: OCR capture (if enabled and triggered)
+        if self.enable_ocr and self._should_capture_ocr(window_data, idle_secs):
+            image = capture_for_ocr(self.config.get("ocr", {}))
+            if self.ocr_queue is not None:
+                self.ocr_queue.submit(
+                    CaptureTask(
+                        timestamp=datetime.now(timezone.utc),
+                        window_data=dict(window_data),
+                        image=image,
+                    )
+                )
+            else:
+                window_data.update(self._ocr_fields(window_data, image))
+            del image
+            self.last_ocr_time = monotonic()
+
+        # Merge the latest background OCR result while still on the same window
+        if self.ocr_queue is not None:
+            ocr_result = self.ocr_queue.get_last_result()
+            if ocr_result and ocr_result["window"] == (
+                window_data.get("app"),
+                window_data.get("title"),
+            ):
+                window_data.update(ocr_result["fields"])
 
         # Step 4: Apply privacy filters
-        window_data = apply_privacy_filters(window_data, self.config.get("privacy", {}))
+        window_data = apply_privacy_filters(window_data, privacy_config)
         if window_data is None:
             # Event was filtered out entirely
             return None
@@ -252,21 +287,177 @@ class EnhancedWatcher:
 
         return window_data
 
+    def _process_ocr_task(self, task: "CaptureTask") -> dict:
+        """Run OCR for a queued capture (background worker)."""
+        window_data = task.window_data
+        return {
+            "window": (window_data.get("app"), window_data.get("title")),
+            "fields": self._ocr_fields(window_data, task.image),
+        }
+
+    def _ocr_fields(self, window_data: dict, image) -> dict:
+        """
+        Get the OCR/LLM fields for a capture.
+
+        Reuses the previous capture's fields if the screen is unchanged,
+        otherwise runs OCR (adding the results to window_data). Runs on the
+        thread doing OCR, which owns the change and diff detectors.
+        """
+        window = (window_data.get("app"), window_data.get("title"))
+        if window != self.last_ocr_window:
+            # New window: force fresh OCR and LLM analysis rather than
+            # comparing against another window's capture
+            if self.screen_change_detector is not None:
+                self.screen_change_detector.reset()
+            if self.ocr_diff_detector:
+                self.ocr_diff_detector.force_next_llm()
+                logger.debug("Window changed, resetting OCR diff detector")
+            self.last_ocr_window = window
+            self.last_ocr_fields = None
+
+        if (
+            image is not None
+            and self.screen_change_detector is not None
+            and self.screen_change_detector.is_unchanged(image)
+            and self.last_ocr_fields is not None
+        ):
+            # Same screen as the last capture: reuse its OCR/LLM results
+            try:
+                image.close()
+            except Exception:
+                pass
+            return self.last_ocr_fields
+
+        self._run_ocr(window_data, image)
+        self.last_ocr_fields = {
+            field: window_data[field] for field in _OCR_FIELDS if field in window_data
+        }
+        return self.last_ocr_fields
+
+    def _llm_cache_key(self, window_data: dict) -> Optional[str]:
+        """Key for the persistent LLM cache, or None if it can't be used."""
+        if self.llm_cache is None:
+            return None
+        screen = self.screen_change_detector.last_hash
+        if screen is None:
+            return None
+        # Results for windows the privacy filters exclude or redact stay out of the cache
+        filtered = apply_privacy_filters(window_data, self.config.get("privacy", {}))
+        if filtered is None or any(
+            filtered.get(field) != window_data.get(field) for field in ("title", "url")
+        ):
+            return None
+        app = window_data.get("app", "")
+        title = hashlib.sha1(window_data.get("title", "").encode()).hexdigest()
+        return f"{screen:016x}:{self.llm_model}:{app}:{title}"
+
+    def _run_ocr(self, window_data: dict, image) -> None:
+        """Run OCR (and LLM enhancement) and add the results to window_data."""
+        ocr_config = self.config.get("ocr", {})
+
+        # Use structured OCR to get position-based text extraction
+        structured_ocr = None
+        if image:
+            try:
+                structured_ocr = ocr_image_structured(image, ocr_config)
+            finally:
+                # Explicitly close and delete image to prevent memory leak
+                try:
+                    image.close()
+                except Exception:
+                    pass
+                del image
+
+        # Keywords/entities come from the structured pass's text; only a
+        # multi-monitor capture needs a separate OCR run
+        ocr_config_with_text = {**ocr_config, "extract_mode": "full_text"}
+        if structured_ocr is not None and not ocr_config.get("capture_all_monitors", False):
+            ocr_data = extract_text_data(structured_ocr.get("full_text", ""), ocr_config_with_text)
+        else:
+            ocr_data = capture_and_ocr(ocr_config_with_text)
+        if not ocr_data:
+            return
+
+        window_data["ocr_keywords"] = ocr_data.get("keywords", [])
+        if ocr_data.get("entities"):
+            window_data["ocr_entities"] = ocr_data["entities"]
+
+        # Add barcode data if detected
+        if structured_ocr and structured_ocr.get("barcodes"):
+            window_data["barcodes"] = structured_ocr["barcodes"]
+
+        # Step 3b: LLM enhancement of OCR text
+        if not self.enable_llm or not ocr_data.get("text"):
+            return
+
+        title_bar = structured_ocr.get("title_bar") if structured_ocr else None
+        llm_result = self._get_llm_result(window_data, ocr_data["text"], title_bar)
+        if llm_result:
+            self._merge_llm_result(window_data, llm_result)
+
+    def _get_llm_result(
+        self, window_data: dict, ocr_text: str, title_bar: Optional[str]
+    ) -> Optional[dict]:
+        """Get the LLM analysis of OCR text, reusing earlier results where possible."""
+        if title_bar:
+            # Prepend title bar text for better document detection
+            ocr_text = f"[TITLE BAR: {title_bar}]\n\n{ocr_text}"
+
+        # Skip the LLM if the OCR content hasn't changed enough
+        if self.ocr_diff_detector:
+            should_run_llm, diff_reason = self.ocr_diff_detector.should_run_llm(
+                ocr_text, window_data
+            )
+            if not should_run_llm:
+                logger.debug(f"Reusing cached LLM result ({diff_reason})")
+                return self.last_ocr_result
+
+        cache_key = self._llm_cache_key(window_data)
+        llm_result = self.llm_cache.get(cache_key) if cache_key else None
+        if llm_result:
+            logger.debug("Reusing persisted LLM result for this screen")
+        else:
+            llm_result = summarize_ocr_with_llm(
+                ocr_text,
+                model=self.llm_model,
+                timeout=self.llm_timeout,
+            )
+            if llm_result and cache_key:
+                self.llm_cache.set(cache_key, llm_result)
+
+        # Cache result for potential reuse
+        if llm_result:
+            self.last_ocr_result = llm_result
+        return llm_result
+
+    def _merge_llm_result(self, window_data: dict, llm_result: dict) -> None:
+        """Merge LLM insights into window_data."""
+        for src, dst in _LLM_FIELDS:
+            value = llm_result.get(src)
+            if _is_valid_llm_value(value):
+                window_data[dst] = value
+
+        # Merge LLM keywords with OCR keywords
+        llm_keywords = llm_result.get("keywords")
+        if llm_keywords and isinstance(llm_keywords, list):
+            llm_keywords = [k for k in llm_keywords if _is_valid_llm_value(k)]
+            # LLM keywords first: they rank above raw OCR terms
+            window_data["ocr_keywords"] = list(
+                dict.fromkeys(chain(llm_keywords, window_data.get("ocr_keywords", ())))
+            )[:25]
+
+        logger.debug(
+            f"LLM: doc={llm_result.get('document')}, client={llm_result.get('client')}, page={llm_result.get('page')}"
+        )
+
     def _is_remote_desktop_app(self, app_name: str) -> bool:
         """Check if the current app is a remote desktop application."""
         if not app_name:
             return False
 
-        smart_config = self.config.get("smart_capture", {})
-        remote_apps = smart_config.get("remote_desktop_apps", [])
-
-        app_lower = app_name.lower()
-        for remote_app in remote_apps:
-            if remote_app.lower() in app_lower:
-                return True
-        return False
+        return bool(self._remote_app_re and self._remote_app_re.search(app_name.lower()))
 
-    def _should_capture_ocr(self, current_data: dict) -> bool:
+    def _should_capture_ocr(self, current_data: dict, idle_secs: Optional[float] = None) -> bool:
         """
         Determine if OCR capture should be triggered.
 
@@ -277,8 +468,9 @@ class EnhancedWatcher:
         4. Capture periodically if same window (but less frequently)
         """
         # Check if user is idle - skip OCR to save resources
-        if self.idle_detector and self.idle_detector.is_idle():
-            idle_secs = self.idle_detector.get_idle_seconds()
+        if idle_secs is None:
+            idle_secs = self._get_idle_seconds()
+        if idle_secs > self.idle_threshold:
             logger.debug(f"User idle ({idle_secs:.0f}s), skipping OCR")
             return False
 
@@ -297,11 +489,6 @@ class EnhancedWatcher:
         ) != self.last_window_data.get("title"):
             window_changed = True
 
-        # Reset OCR diff detector on window change to force fresh LLM analysis
-        if window_changed and self.ocr_diff_detector:
-            self.ocr_diff_detector.force_next_llm()
-            logger.debug("Window changed, resetting OCR diff detector")
-
         # Special handling for remote desktop apps - capture more frequently
         # since we can't detect window changes inside the remote session
         if self._is_remote_desktop_app(current_app):
@@ -309,7 +496,7 @@ class EnhancedWatcher:
             if self.last_ocr_time is None:
                 logger.debug(f"Remote desktop detected ({current_app}), capturing")
                 return True
-            elapsed = (datetime.now(timezone.utc) - self.last_ocr_time).total_seconds()
+            elapsed = monotonic() - self.last_ocr_time
             if elapsed >= remote_interval:
                 logger.debug(
                     f"Remote desktop ({current_app}), periodic capture after {elapsed:.0f}s"
@@ -325,7 +512,7 @@ class EnhancedWatcher:
             interval = ocr_config.get("periodic_interval", 30)
             if self.last_ocr_time is None:
                 return True
-            elapsed = (datetime.now(timezone.utc) - self.last_ocr_time).total_seconds()
+            elapsed = monotonic() - self.last_ocr_time
             return elapsed >= interval
 
         elif trigger == "both" or trigger == "smart":
@@ -337,24 +524,30 @@ class EnhancedWatcher:
             interval = ocr_config.get("periodic_interval", 30)
             if self.last_ocr_time is None:
                 return True
-            elapsed = (datetime.now(timezone.utc) - self.last_ocr_time).total_seconds()
+            elapsed = monotonic() - self.last_ocr_time
             return elapsed >= interval
 
         return False
 
-    def _get_adaptive_poll_time(self) -> float:
+    def _get_idle_seconds(self) -> float:
+        """Seconds since last user input (0 without an idle detector)."""
+        if self.idle_detector:
+            return self.idle_detector.get_idle_seconds()
+        return 0.0
+
+    def _get_adaptive_poll_time(self, idle_secs: Optional[float] = None) -> float:
         """Get adaptive poll time based on user activity."""
         base_poll = self.config.get("watcher", {}).get("poll_time", 5.0)
 
-        if self.idle_detector:
-            idle_secs = self.idle_detector.get_idle_seconds()
+        if idle_secs is None:
+            idle_secs = self._get_idle_seconds()
 
-            if idle_secs > self.idle_threshold * 5:
-                # Very idle (5+ minutes) - poll very slowly
-                return self.idle_poll_time * 2
-            elif idle_secs > self.idle_threshold:
-                # Idle (1+ minute) - poll slowly
-                return self.idle_poll_time
+        if idle_secs > self.idle_threshold * 5:
+            # Very idle (5+ minutes) - poll very slowly
+            return self.idle_poll_time * 2
+        elif idle_secs > self.idle_threshold:
+            # Idle (1+ minute) - poll slowly
+            return self.idle_poll_time
 
         # Active - normal polling
         return base_poll
@@ -369,41 +562,47 @@ class EnhancedWatcher:
             f"Starting main loop (base_poll_time={base_poll_time}s, idle_threshold={self.idle_threshold}s)"
         )
 
+        if self.ocr_queue is not None:
+            self.ocr_queue.start()
+
         with self.client:
             while self.running:
                 try:
+                    # Query idle time once per tick; it's an OS round trip
+                    idle_secs = self._get_idle_seconds()
+
                     # Get adaptive poll time based on activity
-                    poll_time = self._get_adaptive_poll_time()
+                    poll_time = self._get_adaptive_poll_time(idle_secs)
 
                     # Log idle status periodically
-                    if self.idle_detector:
-                        idle_secs = self.idle_detector.get_idle_seconds()
-                        if idle_secs > self.idle_threshold:
-                            logger.debug(
-                                f"User idle ({idle_secs:.0f}s), polling every {poll_time:.0f}s"
-                            )
+                    if idle_secs > self.idle_threshold:
+                        logger.debug(
+                            f"User idle ({idle_secs:.0f}s), polling every {poll_time:.0f}s"
+                        )
 
                     # Capture current state
-                    data = self.capture_state()
+                    data = self.capture_state(idle_secs)
 
                     if data:
+                        # Event is a thin dict subclass (no validation), and
+                        # queued=True hands the send to aw-client's own thread
                         event = Event(timestamp=datetime.now(timezone.utc), data=data)
 
                         self.client.heartbeat(
                             self.bucket_id, event, pulsetime=pulsetime, queued=True
                         )
 
-                        logger.debug(f"Heartbeat: {data.get('app')} - {data.get('title', '')[:50]}")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                f"Heartbeat: {data.get('app')} - {data.get('title', '')[:50]}"
+                            )
 
                         # Update state tracking
                         self.last_window_data = data
 
                     # Periodic garbage collection to prevent memory leaks
-                    now = datetime.now(timezone.utc)
-                    if (
-                        self._last_gc_time is None
-                        or (now - self._last_gc_time).total_seconds() >= self._gc_interval
-                    ):
+                    now = monotonic()
+                    if self._last_gc_time is None or now - self._last_gc_time >= self._gc_interval:
                         collected = gc.collect()
                         if collected > 0:
                             logger.debug(f"Garbage collected {collected} objects")
@@ -415,13 +614,20 @@ class EnhancedWatcher:
                 except Exception as e:
                     logger.error(f"Error in main loop: {e}", exc_info=True)
 
-                sleep(poll_time)
+                self._wake.wait(poll_time)
+                self._wake.clear()
+
+        if self.ocr_queue is not None:
+            self.ocr_queue.stop()
+        if self.llm_cache is not None:
+            self.llm_cache.close()
 
         logger.info("Watcher stopped")
 
     def stop(self):
         """Stop the watcher loop."""
         self.running = False
+        self._wake.set()
 
 
 def _hide_dock_icon():
@@ -9,20 +9,75 @@ Supports multiple OCR engines (in order of preference):
 - Tesseract (cross-platform fallback, slower)
 """
 
-import gc
+import asyncio
 import logging
+import os
 import re
+import shlex
 import sys
-import tempfile
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from .smart_capture import ScreenChangeDetector
 
 logger = logging.getLogger(__name__)
 
+# Try to import screen capture dependencies (optional)
+try:
+    import mss
+    from PIL import Image
+
+    CAPTURE_AVAILABLE = True
+except ImportError:
+    CAPTURE_AVAILABLE = False
+
+# Try to import numpy (optional, used to hand images to RapidOCR)
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Try to import pytesseract (optional, Tesseract via its command line)
+try:
+    import pytesseract
+
+    PYTESSERACT_AVAILABLE = True
+except ImportError:
+    PYTESSERACT_AVAILABLE = False
+
+# Try to import tesserocr (optional, runs Tesseract in-process)
+try:
+    import tesserocr
+
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
 # Check available OCR engines
 OCR_AVAILABLE = False
 OCR_ENGINE = None
 _rapidocr_singleton = None  # Singleton to avoid memory leak from recreating engine
 
+
+def _create_rapidocr():
+    """
+    Create the RapidOCR engine and run it once on a blank frame.
+
+    ONNX Runtime finishes setting up its sessions (memory planning, kernel
+    selection) on the first inference; doing that here keeps it off the first
+    real capture. Graph optimizations are already ORT_ENABLE_ALL by default.
+    """
+    from rapidocr_onnxruntime import RapidOCR
+
+    engine = RapidOCR()
+    engine(np.zeros((640, 640, 3), dtype=np.uint8), use_cls=False)
+    return engine
+
+
 try:
     if sys.platform == "darwin":
         # Try Apple Vision first on macOS (fastest, uses Neural Engine)
@@ -49,10 +104,8 @@ try:
     if not OCR_AVAILABLE:
         # Try RapidOCR (fast, ONNX-based, cross-platform)
         try:
-            from rapidocr_onnxruntime import RapidOCR
-
             # Test that it can initialize - keep as singleton to avoid memory leak
-            _rapidocr_singleton = RapidOCR()
+            _rapidocr_singleton = _create_rapidocr()
             OCR_AVAILABLE = True
             OCR_ENGINE = "rapidocr"
             logger.info("Using RapidOCR (ONNX-based, fast)")
@@ -64,9 +117,10 @@ try:
 
     if not OCR_AVAILABLE:
         # Fall back to Tesseract (slower but widely available)
-        import pytesseract
-
-        pytesseract.get_tesseract_version()
+        if not TESSEROCR_AVAILABLE:
+            if not PYTESSERACT_AVAILABLE:
+                raise ImportError("tesserocr or pytesseract required")
+            pytesseract.get_tesseract_version()
         OCR_AVAILABLE = True
         OCR_ENGINE = "tesseract"
         logger.info("Using Tesseract OCR (fallback)")
@@ -90,68 +144,189 @@ def capture_screen(
     Returns:
         PIL Image object or None
     """
-    try:
-        import mss
-        from PIL import Image
-    except ImportError:
+    if not CAPTURE_AVAILABLE:
         logger.error("mss and Pillow required. Run: pip install mss Pillow")
         return None
 
-    try:
-        with mss.mss() as sct:
-            if window_only:
-                if sys.platform == "win32":
-                    # Get active window bounds on Windows
-                    monitor = _get_active_window_bounds_windows()
-                    if monitor is None:
-                        # Fallback to monitor under cursor
-                        monitor = _get_monitor_under_cursor_windows(sct)
-                    if monitor is None:
-                        monitor = sct.monitors[1]  # Primary monitor
-
-                elif sys.platform == "darwin":
-                    # Get active window bounds on macOS
-                    monitor = _get_active_window_bounds_macos(sct)
-                    if monitor is None:
-                        # Fallback to monitor under cursor
-                        monitor = _get_monitor_under_cursor_macos(sct)
-                    if monitor is None:
-                        monitor = sct.monitors[1]  # Fallback to primary
-                else:
-                    monitor = sct.monitors[1]  # Primary monitor
-            elif monitor_index is not None:
-                # Capture specific monitor
-                if monitor_index < len(sct.monitors):
-                    monitor = sct.monitors[monitor_index]
-                else:
-                    monitor = sct.monitors[1]
-            else:
-                # Capture monitor under mouse cursor
-                if sys.platform == "win32":
-                    monitor = _get_monitor_under_cursor_windows(sct)
-                elif sys.platform == "darwin":
-                    monitor = _get_monitor_under_cursor_macos(sct)
-                else:
-                    monitor = sct.monitors[1]
-
-                if monitor is None:
-                    monitor = sct.monitors[1]  # Primary monitor
-
-            # Capture
-            screenshot = sct.grab(monitor)
+    for attempt in range(2):
+        try:
+            sct = _get_sct()
+            screenshot = sct.grab(_select_monitor(sct, window_only, monitor_index))
 
             # Convert to PIL Image
-            img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
+            return _screenshot_to_image(screenshot)
 
-            # Clear screenshot buffer to free memory
-            del screenshot
+        except mss.ScreenShotError as e:
+            # The display may have been reconfigured; retry once with a fresh instance
+            _reset_sct()
+            if attempt:
+                logger.error(f"Screen capture failed: {e}")
+        except Exception as e:
+            logger.error(f"Screen capture failed: {e}")
+            return None
 
-            return img
+    return None
+
+
+def _screenshot_to_image(screenshot):
+    """Convert an mss screenshot to an RGB PIL image."""
+    # Decode straight from the grab buffer: screenshot.bgra would first copy
+    # the whole frame into a new bytes object
+    return Image.frombytes("RGB", screenshot.size, screenshot.raw, "raw", "BGRX")
+
+
+def _select_monitor(sct, window_only: bool, monitor_index: Optional[int]) -> Dict[str, int]:
+    """Pick the region to capture (see capture_screen)."""
+    if window_only:
+        if sys.platform == "win32":
+            # Get active window bounds on Windows
+            monitor = _get_active_window_bounds(sct)
+            if monitor is None:
+                # Fallback to monitor under cursor
+                monitor = _get_monitor_under_cursor_windows(sct)
+            if monitor is None:
+                monitor = sct.monitors[1]  # Primary monitor
+
+        elif sys.platform == "darwin":
+            # Get active window bounds on macOS
+            monitor = _get_active_window_bounds(sct)
+            if monitor is None:
+                # Fallback to monitor under cursor
+                monitor = _get_monitor_under_cursor_macos(sct)
+            if monitor is None:
+                monitor = sct.monitors[1]  # Fallback to primary
+        else:
+            monitor = sct.monitors[1]  # Primary monitor
+    elif monitor_index is not None:
+        # Capture specific monitor
+        if monitor_index < len(sct.monitors):
+            monitor = sct.monitors[monitor_index]
+        else:
+            monitor = sct.monitors[1]
+    else:
+        # Capture monitor under mouse cursor
+        if sys.platform == "win32":
+            monitor = _get_monitor_under_cursor_windows(sct)
+        elif sys.platform == "darwin":
+            monitor = _get_monitor_under_cursor_macos(sct)
+        else:
+            monitor = sct.monitors[1]
 
-    except Exception as e:
-        logger.error(f"Screen capture failed: {e}")
+        if monitor is None:
+            monitor = sct.monitors[1]  # Primary monitor
+
+    return monitor
+
+
+# mss instances hold a display/device-context handle, so one is reused per
+# thread instead of opening a new one per capture. mss caches the monitor
+# layout, so the instance is replaced periodically to notice display changes.
+_sct_local = threading.local()
+_SCT_MAX_AGE = 60.0  # seconds
+
+
+def _get_sct():
+    """Get this thread's mss instance, creating it if missing or stale."""
+    sct = getattr(_sct_local, "sct", None)
+    if sct is not None and time.monotonic() - _sct_local.created < _SCT_MAX_AGE:
+        return sct
+
+    _reset_sct()
+    sct = mss.mss()
+    _sct_local.sct = sct
+    _sct_local.created = time.monotonic()
+    return sct
+
+
+def _reset_sct() -> None:
+    """Close and forget this thread's mss instance."""
+    sct = getattr(_sct_local, "sct", None)
+    _sct_local.sct = None
+    if sct is not None:
+        try:
+            sct.close()
+        except Exception:
+            pass
+
+
+def capture_for_ocr(config: Dict[str, Any]) -> Optional[Any]:
+    """
+    Capture the screen region to OCR.
+
+    OCR time grows with pixel count, so by default only the active window is
+    captured, and wide captures are downscaled. The capture is also converted
+    to grayscale once up front, so the downscale, screen hash, OCR engine and
+    barcode scan all work on one channel instead of three.
+
+    Args:
+        config: OCR configuration dict
+            - capture_region: str - "window" (default) or "monitor" (under the cursor)
+            - max_width: int - Downscale wider captures to this width (0 = never)
+            - grayscale: bool - Convert the capture to grayscale (default True)
+
+    Returns:
+        PIL Image object or None
+    """
+    window_only = config.get("capture_region", "window") == "window"
+    image = capture_screen(window_only=window_only)
+    if image is None:
+        # Fall back to the other capture region
+        image = capture_screen(window_only=not window_only)
+    if image is None:
         return None
 
+    return _prepare_for_ocr(image, config)
+
+
+def _prepare_for_ocr(image, config: Dict[str, Any]):
+    """Convert a capture to grayscale and downscale it per the OCR config, closing the original."""
+    if config.get("grayscale", True) and image.mode != "L":
+        gray = image.convert("L")
+        image.close()
+        image = gray
+
+    return _downscale_for_ocr(image, config.get("max_width", 1600))
+
+
+def _downscale_for_ocr(image, max_width: int):
+    """Downscale an image to at most max_width pixels wide, closing the original."""
+    if not max_width or image.width <= max_width:
+        return image
+
+    height = max(1, round(image.height * max_width / image.width))
+    # Bilinear after a fast integer box reduction: much cheaper than Lanczos on
+    # full-resolution frames, and text stays legible for OCR
+    resized = image.resize((max_width, height), Image.Resampling.BILINEAR, reducing_gap=2.0)
+    image.close()
+    return resized
+
+
+# Window bounds come from cross-process Win32/Quartz calls (on macOS, an
+# enumeration of every on-screen window), so a lookup is reused briefly: a
+# capture and its fallback within one tick then share a single query.
+_BOUNDS_MAX_AGE = 0.25  # seconds
+_bounds_cache: Tuple[float, Optional[Dict[str, int]]] = (float("-inf"), None)
+
+
+def _get_active_window_bounds(sct) -> Optional[Dict[str, int]]:
+    """Get the bounds of the active window, reusing a lookup from the last 250ms."""
+    global _bounds_cache
+
+    now = time.monotonic()
+    cached_at, bounds = _bounds_cache
+    if now - cached_at < _BOUNDS_MAX_AGE:
+        return bounds
+
+    if sys.platform == "win32":
+        bounds = _get_active_window_bounds_windows()
+    elif sys.platform == "darwin":
+        bounds = _get_active_window_bounds_macos(sct)
+    else:
+        bounds = None
+
+    _bounds_cache = (now, bounds)
+    return bounds
+
 
 def _get_active_window_bounds_windows() -> Optional[Dict[str, int]]:
     """Get the bounds of the active window on Windows."""
@@ -188,17 +363,8 @@ def _get_monitor_under_cursor_windows(sct) -> Optional[Dict[str, int]]:
 
         point = POINT()
         ctypes.windll.user32.GetCursorPos(ctypes.byref(point))
-        cursor_x, cursor_y = point.x, point.y
-
-        # Find which monitor contains the cursor
-        for monitor in sct.monitors[1:]:  # Skip the virtual all-monitors monitor
-            if (
-                monitor["left"] <= cursor_x < monitor["left"] + monitor["width"]
-                and monitor["top"] <= cursor_y < monitor["top"] + monitor["height"]
-            ):
-                return monitor
 
-        return None
+        return _monitor_at(sct, point.x, point.y)
     except Exception as e:
         logger.debug(f"Error getting Windows monitor under cursor: {e}")
         return None
@@ -207,38 +373,45 @@ def _get_monitor_under_cursor_windows(sct) -> Optional[Dict[str, int]]:
 def _get_monitor_under_cursor_macos(sct) -> Optional[Dict[str, int]]:
     """Get the monitor under the mouse cursor on macOS."""
     try:
-        from AppKit import NSEvent, NSScreen
-
-        # Get mouse position in Cocoa coordinates (origin bottom-left)
-        mouse_ns = NSEvent.mouseLocation()
-
-        # Get screens and find which one contains the cursor
-        screens = NSScreen.screens()
-        if not screens:
-            return None
+        from Quartz import CGEventCreate, CGEventGetLocation
 
-        primary_height = screens[0].frame().size.height
+        # Quartz reports the cursor in global display coordinates (origin
+        # top-left), the same space as the mss monitor rectangles
+        location = CGEventGetLocation(CGEventCreate(None))
 
-        for i, screen in enumerate(screens):
-            frame = screen.frame()
-            if (
-                frame.origin.x <= mouse_ns.x <= frame.origin.x + frame.size.width
-                and frame.origin.y <= mouse_ns.y <= frame.origin.y + frame.size.height
-            ):
-                # Found the screen - now get the corresponding mss monitor
-                # mss monitors are 1-indexed (0 is virtual all-monitors)
-                if i + 1 < len(sct.monitors):
-                    return sct.monitors[i + 1]
-
-        return None
+        return _monitor_at(sct, location.x, location.y)
     except ImportError:
-        logger.debug("AppKit not available for macOS cursor detection")
+        logger.debug("Quartz not available for macOS cursor detection")
         return None
     except Exception as e:
         logger.debug(f"Error getting macOS monitor under cursor: {e}")
         return None
 
 
+def _monitor_at(sct, x: float, y: float) -> Optional[Dict[str, int]]:
+    """Get the monitor containing a point in global screen coordinates."""
+    for left, top, right, bottom, monitor in _monitor_rects(sct):
+        if left <= x < right and top <= y < bottom:
+            return monitor
+    return None
+
+
+def _monitor_rects(sct) -> Tuple[Tuple[int, int, int, int, Dict[str, int]], ...]:
+    """
+    Get (left, top, right, bottom, monitor) for each physical monitor.
+
+    Built once per mss instance, which is itself replaced periodically and on
+    capture errors, so display changes are picked up with it.
+    """
+    if getattr(_sct_local, "rects_sct", None) is not sct:
+        _sct_local.rects = tuple(
+            (m["left"], m["top"], m["left"] + m["width"], m["top"] + m["height"], m)
+            for m in sct.monitors[1:]  # Skip the virtual all-monitors monitor
+        )
+        _sct_local.rects_sct = sct
+    return _sct_local.rects
+
+
 def _get_active_window_bounds_macos(sct) -> Optional[Dict[str, int]]:
     """
     Get the bounds of the active window on macOS.
@@ -268,7 +441,8 @@ def _get_active_window_bounds_macos(sct) -> Optional[Dict[str, int]]:
         options = kCGWindowListOptionOnScreenOnly | kCGWindowListExcludeDesktopElements
         window_list = CGWindowListCopyWindowInfo(options, kCGNullWindowID)
 
-        # Find the frontmost window of the active app
+        # Find the frontmost window of the active app (the list is ordered
+        # front to back, so the first match is taken)
         for window in window_list:
             if window.get("kCGWindowOwnerPID") == app_pid:
                 bounds = window.get("kCGWindowBounds", {})
@@ -297,12 +471,12 @@ def get_monitor_count() -> int:
     Returns:
         Number of monitors (excluding the virtual 'all monitors' monitor)
     """
-    try:
-        import mss
+    if not CAPTURE_AVAILABLE:
+        return 1
 
-        with mss.mss() as sct:
-            # monitors[0] is the virtual monitor containing all screens
-            return len(sct.monitors) - 1
+    try:
+        # monitors[0] is the virtual monitor containing all screens
+        return len(_get_sct().monitors) - 1
     except Exception:
         return 1
 
@@ -314,24 +488,24 @@ def capture_all_monitors() -> List[Any]:
     Returns:
         List of PIL Image objects, one per monitor
     """
-    try:
-        import mss
-        from PIL import Image
-    except ImportError:
+    if not CAPTURE_AVAILABLE:
         logger.error("mss and Pillow required")
         return []
 
     images = []
     try:
-        with mss.mss() as sct:
-            # Skip monitors[0] which is the virtual 'all monitors' combined
-            for i, monitor in enumerate(sct.monitors[1:], start=1):
-                screenshot = sct.grab(monitor)
-                img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
-                images.append(img)
-                logger.debug(f"Captured monitor {i}: {monitor['width']}x{monitor['height']}")
-                # Clear screenshot buffer to free memory
-                del screenshot
+        sct = _get_sct()
+        # Skip monitors[0] which is the virtual 'all monitors' combined
+        for i, monitor in enumerate(sct.monitors[1:], start=1):
+            screenshot = sct.grab(monitor)
+            img = _screenshot_to_image(screenshot)
+            images.append(img)
+            logger.debug(f"Captured monitor {i}: {monitor['width']}x{monitor['height']}")
+            # Free this grab buffer before the next monitor is grabbed
+            del screenshot
+    except mss.ScreenShotError as e:
+        _reset_sct()
+        logger.error(f"Multi-monitor capture failed: {e}")
     except Exception as e:
         logger.error(f"Multi-monitor capture failed: {e}")
 
@@ -348,6 +522,9 @@ class TieredCaptureManager:
     3. All monitors (rare) - every 2-5 minutes for full context
 
     This saves CPU/memory while maintaining good context capture.
+
+    Only captures; it doesn't OCR. To overlap OCR with the next capture, hand
+    the images to a smart_capture.ProcessingQueue worker, as the watcher does.
     """
 
     def __init__(
@@ -355,7 +532,16 @@ class TieredCaptureManager:
         active_window_interval: float = 5.0,
         active_monitor_interval: float = 30.0,
         full_capture_interval: float = 120.0,  # 2 minutes
+        skip_unchanged: bool = True,
     ):
+        """
+        Args:
+            active_window_interval: Seconds between active window captures
+            active_monitor_interval: Seconds between active monitor captures
+            full_capture_interval: Seconds between all-monitor captures
+            skip_unchanged: Drop window/monitor captures that look the same as
+                the previous one (mode "skip_unchanged"), so they aren't OCRed
+        """
         self.active_window_interval = active_window_interval
         self.active_monitor_interval = active_monitor_interval
         self.full_capture_interval = full_capture_interval
@@ -369,14 +555,15 @@ class TieredCaptureManager:
         self._full_capture_cache = None
         self._full_capture_ocr_cache = None
 
+        # Perceptual hash of the previous window/monitor capture
+        self._change_detector = ScreenChangeDetector() if skip_unchanged else None
+
     def get_capture_mode(self, window_changed: bool = False) -> str:
         """
         Determine which capture mode to use based on timing and window state.
 
         Returns: "active_window", "active_monitor", "full", or "skip"
         """
-        import time
-
         now = time.time()
 
         # Check if full capture is due (every 2-5 minutes)
@@ -407,12 +594,10 @@ class TieredCaptureManager:
 
         Returns:
             Dict with:
-            - image: PIL Image (or list for full capture)
-            - mode: Capture mode used
+            - image: PIL Image (or list for full capture), None if skipped
+            - mode: Capture mode used, or "skip_unchanged" if the screen is unchanged
             - monitor_count: Number of monitors captured
         """
-        import time
-
         if mode == "auto":
             mode = self.get_capture_mode(window_changed)
 
@@ -429,6 +614,8 @@ class TieredCaptureManager:
             result["monitor_count"] = 1 if image else 0
             self._last_active_window_capture = now
             logger.debug("Captured active window")
+            if self._is_unchanged(image):
+                return {"image": None, "mode": "skip_unchanged", "monitor_count": 0}
 
         elif mode == "active_monitor":
             # Capture the monitor where mouse/active window is
@@ -438,6 +625,8 @@ class TieredCaptureManager:
             self._last_active_monitor_capture = now
             self._last_active_window_capture = now
             logger.debug("Captured active monitor")
+            if self._is_unchanged(image):
+                return {"image": None, "mode": "skip_unchanged", "monitor_count": 0}
 
         elif mode == "full":
             # Capture all monitors
@@ -452,10 +641,18 @@ class TieredCaptureManager:
 
         return result
 
+    def _is_unchanged(self, image) -> bool:
+        """Check whether a capture matches the previous one, closing it if so."""
+        if image is None or self._change_detector is None:
+            return False
+        if not self._change_detector.is_unchanged(image):
+            return False
+        image.close()
+        logger.debug("Screen unchanged, skipping capture")
+        return True
+
     def get_status(self) -> Dict[str, Any]:
         """Get timing status for all capture tiers."""
-        import time
-
         now = time.time()
         return {
             "since_active_window": now - self._last_active_window_capture,
@@ -493,13 +690,14 @@ def get_tiered_capture_manager(
     return _tiered_capture_manager
 
 
-def ocr_image(image, engine: str = "auto") -> str:
+def ocr_image(image, engine: str = "auto", tesseract_config: Optional[str] = None) -> str:
     """
     Perform OCR on an image.
 
     Args:
         image: PIL Image object
         engine: "auto", "apple_vision", "windows", "rapidocr", or "tesseract"
+        tesseract_config: Tesseract command line options (see tesseract_options)
 
     Returns:
         Extracted text as string
@@ -507,27 +705,26 @@ def ocr_image(image, engine: str = "auto") -> str:
     if engine == "auto":
         engine = OCR_ENGINE
 
-    if engine == "apple_vision":
-        return _ocr_apple_vision(image)
-    elif engine == "windows":
-        return _ocr_windows(image)
-    elif engine == "rapidocr":
-        return _ocr_rapidocr(image)
-    elif engine == "tesseract":
-        return _ocr_tesseract(image)
-    else:
+    if engine == "tesseract":
+        return _ocr_tesseract(image, tesseract_config)
+
+    ocr_function = _OCR_FUNCTIONS.get(engine)
+    if ocr_function is None:
         logger.error(f"Unknown OCR engine: {engine}")
         return ""
+    return ocr_function(image)
 
 
-def ocr_image_structured(image) -> Dict[str, Any]:
+def ocr_image_structured(image, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Perform structured OCR on an image, extracting text by screen position.
 
-    Only available with Apple Vision on macOS. Falls back to basic OCR on other platforms.
+    Available with Apple Vision on macOS and with Tesseract. Falls back to basic
+    OCR with other engines.
 
     Args:
         image: PIL Image object
+        config: OCR configuration dict (engine and Tesseract options)
 
     Returns:
         Dict with:
@@ -537,45 +734,30 @@ def ocr_image_structured(image) -> Dict[str, Any]:
         - full_text: All text combined
         - barcodes: List of detected barcode/QR payloads
     """
-    if OCR_ENGINE == "apple_vision":
+    config = config or {}
+    engine = config.get("engine", "auto")
+    if engine == "auto":
+        engine = OCR_ENGINE
+
+    if engine == "apple_vision":
         return _ocr_apple_vision_structured(image)
+    elif engine == "tesseract":
+        return _ocr_tesseract_structured(image, tesseract_options(config))
     else:
-        # Fallback for non-Apple platforms
-        text = ocr_image(image)
+        # Fallback for engines without position data
+        text = ocr_image(image, engine=engine)
         return {"title_bar": "", "menu_bar": "", "content": text, "full_text": text, "barcodes": []}
 
 
 def _ocr_apple_vision(image) -> str:
     """OCR using Apple Vision Framework (macOS Neural Engine accelerated)."""
-    import os
-
-    temp_path = None
     try:
-        from ocrmac import ocrmac
-
-        # Save image to temp file (ocrmac requires file path)
-        # Use delete=False so we control cleanup, ensuring it happens even on error
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            image.save(f, format="PNG")
-            temp_path = f.name
-
-        # Run OCR using Apple Vision
-        result = ocrmac.OCR(temp_path).recognize()
-
-        # Extract text from results (list of tuples)
-        text = " ".join([r[0] for r in result])
-        return text
+        observations, _ = _vision_recognize(image)
+        return " ".join(text for text, _ in observations)
 
     except Exception as e:
         logger.error(f"Apple Vision OCR failed: {e}")
         return ""
-    finally:
-        # Always clean up temp file
-        if temp_path and os.path.exists(temp_path):
-            try:
-                os.unlink(temp_path)
-            except OSError:
-                pass
 
 
 def _ocr_apple_vision_structured(image) -> Dict[str, Any]:
@@ -588,138 +770,145 @@ def _ocr_apple_vision_structured(image) -> Dict[str, Any]:
     - content: Main content area
     - barcodes: Any detected barcodes/QR codes
     """
-    import os
-
-    temp_path = None
     try:
-        from ocrmac import ocrmac
-
-        # Save image to temp file
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            image.save(f, format="PNG")
-            temp_path = f.name
-
-        # Run OCR with position data
-        result = ocrmac.OCR(temp_path).recognize()
+        # Text and barcodes are detected in one Vision pass
+        observations, barcodes = _vision_recognize(image, detect_barcodes=True)
 
         # Categorize text by Y position (Vision uses normalized coords, 0=bottom, 1=top)
         title_bar = []  # y > 0.92 (top ~8% of screen)
         menu_bar = []  # 0.85 < y <= 0.92 (next ~7%)
         content = []  # y <= 0.85 (rest of screen)
 
-        for item in result:
-            text = item[0]
-            # item[1] is confidence, item[2] is bounding box
-            if len(item) >= 3 and item[2]:
-                bbox = item[2]
-                # bbox format: (x, y, width, height) - y is from bottom
-                y_pos = bbox[1] if len(bbox) >= 2 else 0
-
-                if y_pos > 0.92:
-                    title_bar.append(text)
-                elif y_pos > 0.85:
-                    menu_bar.append(text)
-                else:
-                    content.append(text)
+        for text, y_pos in observations:
+            if y_pos > 0.92:
+                title_bar.append(text)
+            elif y_pos > 0.85:
+                menu_bar.append(text)
             else:
                 content.append(text)
 
-        # Try to detect barcodes/QR codes using Vision framework directly
-        barcodes = _detect_barcodes_vision(temp_path) if os.path.exists(temp_path) else []
-
         return {
             "title_bar": " ".join(title_bar),
             "menu_bar": " ".join(menu_bar),
             "content": " ".join(content),
-            "full_text": " ".join([r[0] for r in result]),
+            "full_text": " ".join(text for text, _ in observations),
             "barcodes": barcodes,
         }
 
     except Exception as e:
         logger.error(f"Apple Vision structured OCR failed: {e}")
         return {"title_bar": "", "menu_bar": "", "content": "", "full_text": "", "barcodes": []}
-    finally:
-        # Always clean up temp file
-        if temp_path and os.path.exists(temp_path):
-            try:
-                os.unlink(temp_path)
-            except OSError:
-                pass
 
 
-def _detect_barcodes_vision(image_path: str) -> List[str]:
+def _vision_recognize(
+    image, detect_barcodes: bool = False
+) -> Tuple[List[Tuple[str, float]], List[str]]:
     """
-    Detect barcodes and QR codes using Apple Vision Framework.
+    Run Apple Vision text recognition (and optionally barcode detection) in-process.
+
+    The image is handed to Vision as a CGImage built from its pixel buffer, so
+    there is no PNG encode, temp file or decode in between.
 
-    Returns list of detected barcode/QR code payloads.
+    Returns:
+        ([(text, y position of the bottom edge, normalized 0=bottom..1=top)],
+         [barcode payloads])
     """
-    try:
-        import Quartz
-        import Vision
-        from Foundation import NSURL
+    import objc
+    import Vision
+
+    with objc.autorelease_pool():
+        text_request = Vision.VNRecognizeTextRequest.alloc().init()
+        text_request.setRecognitionLevel_(Vision.VNRequestTextRecognitionLevelAccurate)
+        text_request.setUsesLanguageCorrection_(True)
+        requests = [text_request]
+
+        barcode_request = None
+        if detect_barcodes:
+            barcode_request = Vision.VNDetectBarcodesRequest.alloc().init()
+            requests.append(barcode_request)
+
+        handler = Vision.VNImageRequestHandler.alloc().initWithCGImage_options_(
+            _to_cgimage(image), None
+        )
+        success, error = handler.performRequests_error_(requests, None)
+        if not success:
+            raise RuntimeError(f"Vision request failed: {error}")
 
-        # Load image
-        image_url = NSURL.fileURLWithPath_(image_path)
-        image_source = Quartz.CGImageSourceCreateWithURL(image_url, None)
-        if not image_source:
-            return []
+        observations = []
+        for observation in text_request.results() or []:
+            candidates = observation.topCandidates_(1)
+            if candidates:
+                observations.append((candidates[0].string(), observation.boundingBox().origin.y))
 
-        cg_image = Quartz.CGImageSourceCreateImageAtIndex(image_source, 0, None)
-        if not cg_image:
-            return []
+        barcodes = []
+        if barcode_request is not None:
+            for observation in barcode_request.results() or []:
+                payload = observation.payloadStringValue()
+                if payload:
+                    barcodes.append(payload)
 
-        # Create barcode detection request
-        request = Vision.VNDetectBarcodesRequest.alloc().init()
+    return observations, barcodes
 
-        # Create handler and perform request
-        handler = Vision.VNImageRequestHandler.alloc().initWithCGImage_options_(cg_image, None)
-        success = handler.performRequests_error_([request], None)
 
-        if not success:
-            return []
+def _to_cgimage(image):
+    """Wrap a PIL image's pixels in a CGImage (grayscale or RGB)."""
+    import Quartz
+    from Foundation import NSData
 
-        # Extract barcode payloads
-        barcodes = []
-        for observation in request.results() or []:
-            if hasattr(observation, "payloadStringValue") and observation.payloadStringValue():
-                barcodes.append(observation.payloadStringValue())
+    if image.mode == "L":
+        data = image.tobytes()
+        color_space = Quartz.CGColorSpaceCreateDeviceGray()
+        bits_per_pixel = 8
+        bitmap_info = Quartz.kCGImageAlphaNone
+    else:
+        # 4 bytes per pixel with the padding byte ignored
+        data = image.convert("RGBX").tobytes()
+        color_space = Quartz.CGColorSpaceCreateDeviceRGB()
+        bits_per_pixel = 32
+        bitmap_info = Quartz.kCGImageAlphaNoneSkipLast
+
+    width, height = image.size
+    provider = Quartz.CGDataProviderCreateWithCFData(NSData.dataWithBytes_length_(data, len(data)))
+    return Quartz.CGImageCreate(
+        width,
+        height,
+        8,
+        bits_per_pixel,
+        width * bits_per_pixel // 8,
+        color_space,
+        bitmap_info,
+        provider,
+        None,
+        False,
+        Quartz.kCGRenderingIntentDefault,
+    )
 
-        return barcodes
 
-    except ImportError:
-        logger.debug("Vision framework not available for barcode detection")
-        return []
-    except Exception as e:
-        logger.debug(f"Barcode detection failed: {e}")
-        return []
+# Event loop for the async Windows OCR API, running on its own daemon thread
+_winocr_loop: Optional[asyncio.AbstractEventLoop] = None
+_winocr_loop_lock = threading.Lock()
+
+
+def _get_winocr_loop() -> asyncio.AbstractEventLoop:
+    """Get the Windows OCR event loop, starting it on first use."""
+    global _winocr_loop
+    with _winocr_loop_lock:
+        if _winocr_loop is None:
+            _winocr_loop = asyncio.new_event_loop()
+            threading.Thread(target=_winocr_loop.run_forever, daemon=True).start()
+    return _winocr_loop
 
 
 def _ocr_windows(image) -> str:
     """OCR using Windows OCR API."""
     try:
-        import asyncio
-        from io import BytesIO
-
         import winocr
 
-        # Save image to bytes
-        buffer = BytesIO()
-        image.save(buffer, format="PNG")
-        image_bytes = buffer.getvalue()
-
-        # Run OCR (async API)
-        async def run_ocr():
-            result = await winocr.recognize_pil(image, lang="en")
-            return result.text
-
-        # Run async function
-        loop = asyncio.new_event_loop()
-        try:
-            text = loop.run_until_complete(run_ocr())
-        finally:
-            loop.close()
-
-        return text
+        # Run OCR (async API) on the persistent loop instead of a new loop per call
+        future = asyncio.run_coroutine_threadsafe(
+            winocr.recognize_pil(image, lang="en"), _get_winocr_loop()
+        )
+        return future.result().text
 
     except Exception as e:
         logger.error(f"Windows OCR failed: {e}")
@@ -731,21 +920,20 @@ def _ocr_rapidocr(image) -> str:
     global _rapidocr_singleton
 
     try:
-        import numpy as np
-
         # Use singleton to avoid memory leak from recreating engine
         if _rapidocr_singleton is None:
-            from rapidocr_onnxruntime import RapidOCR
-            _rapidocr_singleton = RapidOCR()
+            _rapidocr_singleton = _create_rapidocr()
 
-        # Convert PIL Image to numpy array
-        img_array = np.array(image)
+        # Convert PIL Image to numpy array. Grayscale captures (the default) are
+        # passed as a single channel; RapidOCR expands them itself. Arrays are
+        # taken as OpenCV-style BGR, so RGB is reversed as a view, not a copy.
+        img_array = np.asarray(image)
+        if img_array.ndim == 3:
+            img_array = img_array[..., 2::-1]
 
-        # Run OCR - returns list of (box, text, confidence) tuples
-        result, _ = _rapidocr_singleton(img_array)
-
-        # Clean up numpy array
-        del img_array
+        # Run OCR - returns list of (box, text, confidence) tuples. Screen text
+        # is upright, so the per-box text direction classifier is skipped
+        result, _ = _rapidocr_singleton(img_array, use_cls=False)
 
         if not result:
             return ""
@@ -767,13 +955,82 @@ def _ocr_rapidocr(image) -> str:
         return ""
 
 
-def _ocr_tesseract(image) -> str:
+# OCR functions for the engines that take only an image (see ocr_image)
+_OCR_FUNCTIONS = {
+    "apple_vision": _ocr_apple_vision,
+    "windows": _ocr_windows,
+    "rapidocr": _ocr_rapidocr,
+}
+
+
+def tesseract_options(config: Dict[str, Any]) -> str:
+    """
+    Build Tesseract command line options from the OCR config.
+
+    Args:
+        config: OCR configuration dict
+            - tesseract_oem: int - OCR engine mode (1 = LSTM only, 3 = default)
+            - tessdata_dir: str - traineddata directory, e.g. a tessdata_fast
+              checkout (integer-quantized models, several times faster); ~ is
+              expanded, as neither pytesseract nor tesserocr does it
+
+    Returns:
+        Options string for pytesseract
+    """
+    options = f"--oem {int(config.get('tesseract_oem', 1))} --psm 3"
+    tessdata_dir = config.get("tessdata_dir")
+    if tessdata_dir:
+        options += f' --tessdata-dir "{os.path.expanduser(tessdata_dir)}"'
+    return options
+
+
+# Persistent tesserocr API, reused across captures; the options it was created with
+_tesserocr_api = None
+_tesserocr_options: Optional[str] = None
+_tesserocr_lock = threading.Lock()
+
+
+def _get_tesserocr_api(options: str):
+    """
+    Get the shared tesserocr API for the given Tesseract options.
+
+    pytesseract starts a tesseract process (and reloads the language data) on
+    every call; tesserocr keeps one engine loaded. Call with _tesserocr_lock held.
+    """
+    global _tesserocr_api, _tesserocr_options
+    if _tesserocr_api is not None and options == _tesserocr_options:
+        return _tesserocr_api
+
+    args = shlex.split(options)
+    kwargs: Dict[str, Any] = {}
+    for flag, value in zip(args, args[1:]):
+        if flag == "--oem":
+            kwargs["oem"] = int(value)
+        elif flag == "--psm":
+            kwargs["psm"] = int(value)
+        elif flag == "--tessdata-dir":
+            kwargs["path"] = value
+
+    if _tesserocr_api is not None:
+        _tesserocr_api.End()
+    _tesserocr_api = tesserocr.PyTessBaseAPI(**kwargs)
+    _tesserocr_options = options
+    return _tesserocr_api
+
+
+def _ocr_tesseract(image, config: Optional[str] = None) -> str:
     """OCR using Tesseract."""
     try:
-        import pytesseract
+        # LSTM engine only with auto page segmentation unless configured otherwise
+        if config is None:
+            config = "--oem 1 --psm 3"
 
-        # Configure for speed vs accuracy
-        config = "--oem 3 --psm 3"  # Default OCR engine mode, auto page segmentation
+        image = _to_grayscale(image)
+        if TESSEROCR_AVAILABLE:
+            with _tesserocr_lock:
+                api = _get_tesserocr_api(config)
+                api.SetImage(image)
+                return api.GetUTF8Text()
 
         text = pytesseract.image_to_string(image, config=config)
         return text
@@ -783,20 +1040,98 @@ def _ocr_tesseract(image) -> str:
         return ""
 
 
-def extract_keywords(text: str, max_keywords: int = 20) -> List[str]:
+def _ocr_tesseract_structured(image, config: str) -> Dict[str, Any]:
     """
-    Extract meaningful keywords from OCR text.
+    OCR using Tesseract with position-based text extraction.
 
-    Filters out:
-    - Very short words
-    - Common stop words
-    - Duplicates
+    A single recognition pass gives both the lines with their positions and
+    the full text, categorized like _ocr_apple_vision_structured.
     """
-    if not text:
-        return []
+    try:
+        image = _to_grayscale(image)
+        if TESSEROCR_AVAILABLE:
+            line_positions = _tesserocr_lines(image, config)
+        else:
+            line_positions = _pytesseract_lines(image, config)
+
+        height = image.height or 1
+        title_bar = []  # top ~8% of image
+        menu_bar = []  # next ~7%
+        content = []  # rest of image
+        all_lines = []
+        for line, top in line_positions:
+            all_lines.append(line)
+            y_pos = top / height
+            if y_pos < 0.08:
+                title_bar.append(line)
+            elif y_pos < 0.15:
+                menu_bar.append(line)
+            else:
+                content.append(line)
+
+        return {
+            "title_bar": " ".join(title_bar),
+            "menu_bar": " ".join(menu_bar),
+            "content": " ".join(content),
+            "full_text": "\n".join(all_lines),
+            "barcodes": [],
+        }
+
+    except Exception as e:
+        logger.error(f"Tesseract structured OCR failed: {e}")
+        return {"title_bar": "", "menu_bar": "", "content": "", "full_text": "", "barcodes": []}
 
-    # Common stop words to filter
-    STOP_WORDS = {
+
+def _to_grayscale(image):
+    """
+    Convert an image to grayscale for Tesseract unless it already is.
+
+    Tesseract binarizes a grayscale image anyway; converting first avoids
+    piping (pytesseract) or copying (tesserocr) three channels to it.
+    """
+    if image.mode == "L":
+        return image
+    return image.convert("L")
+
+
+def _pytesseract_lines(image, config: str) -> List[Tuple[str, int]]:
+    """Text lines with their top y coordinate, from one pytesseract image_to_data call."""
+    data = pytesseract.image_to_data(image, config=config, output_type=pytesseract.Output.DICT)
+
+    # Group words into lines, positioned by their first word
+    lines: Dict[Tuple[int, int, int], List[str]] = {}
+    line_tops: Dict[Tuple[int, int, int], int] = {}
+    for i, word in enumerate(data["text"]):
+        word = word.strip()
+        if not word:
+            continue
+        key = (data["block_num"][i], data["par_num"][i], data["line_num"][i])
+        if key not in lines:
+            lines[key] = []
+            line_tops[key] = data["top"][i]
+        lines[key].append(word)
+
+    return [(" ".join(words), line_tops[key]) for key, words in lines.items()]
+
+
+def _tesserocr_lines(image, config: str) -> List[Tuple[str, int]]:
+    """Text lines with their top y coordinate, from the shared tesserocr API."""
+    level = tesserocr.RIL.TEXTLINE
+    lines = []
+    with _tesserocr_lock:
+        api = _get_tesserocr_api(config)
+        api.SetImage(image)
+        api.Recognize()
+        for result in tesserocr.iterate_level(api.GetIterator(), level):
+            line = " ".join((result.GetUTF8Text(level) or "").split())
+            if line:
+                lines.append((line, result.BoundingBox(level)[1]))
+    return lines
+
+
+# Common stop words to filter from keywords
+_STOP_WORDS = frozenset(
+    {
         "the",
         "a",
         "an",
@@ -884,15 +1219,29 @@ def extract_keywords(text: str, max_keywords: int = 20) -> List[str]:
         "here",
         "there",
     }
+)
 
-    # Tokenize: split on whitespace and punctuation
-    words = re.findall(r"\b[a-zA-Z][a-zA-Z0-9_-]*\b", text.lower())
+# Keyword tokens: split on whitespace and punctuation
+_KEYWORD_TOKEN = re.compile(r"\b[a-zA-Z][a-zA-Z0-9_-]*\b")
 
-    # Filter
+
+def extract_keywords(text: str, max_keywords: int = 20) -> List[str]:
+    """
+    Extract meaningful keywords from OCR text.
+
+    Filters out:
+    - Very short words
+    - Common stop words
+    - Duplicates
+    """
+    if not text:
+        return []
+
+    # Tokenize and filter
     keywords = []
     seen = set()
-    for word in words:
-        if len(word) >= 3 and word not in STOP_WORDS and word not in seen and not word.isdigit():
+    for word in _KEYWORD_TOKEN.findall(text.lower()):
+        if len(word) >= 3 and word not in _STOP_WORDS and word not in seen and not word.isdigit():
             keywords.append(word)
             seen.add(word)
             if len(keywords) >= max_keywords:
@@ -901,6 +1250,27 @@ def extract_keywords(text: str, max_keywords: int = 20) -> List[str]:
     return keywords
 
 
+# Entity patterns as one alternation, so the text is scanned once. Where
+# matches overlap the leftmost wins (e.g. an address inside a URL is part of
+# the URL, not an email).
+_ENTITY_RE = re.compile(
+    # Email addresses
+    r"(?P<emails>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)"
+    # URLs
+    r'|(?P<urls>https?://[^\s<>"{}|\\^`\[\]]+)'
+    # Phone numbers (various formats)
+    r"|(?P<phones>\b(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b)"
+    # Dates (common formats)
+    r"|(?P<dates>\b(?:\d{1,2}[-/]\d{1,2}[-/]\d{2,4}|\d{4}[-/]\d{1,2}[-/]\d{1,2}|"
+    r"(?i:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)(?i:[a-z]*)\.?\s+\d{1,2},?\s+\d{4})\b)"
+    # Money amounts
+    r"|(?P<amounts>\$[\d,]+(?:\.\d{2})?|\b\d+(?:,\d{3})*(?:\.\d{2})?\s*(?:USD|EUR|GBP)\b)"
+)
+
+# Maximum entities kept per kind
+_ENTITY_LIMITS = {"emails": 5, "urls": 5, "phones": 3, "dates": 5, "amounts": 5}
+
+
 def extract_entities(text: str) -> Dict[str, List[str]]:
     """
     Extract named entities from OCR text.
@@ -917,37 +1287,14 @@ def extract_entities(text: str) -> Dict[str, List[str]]:
     if not text:
         return entities
 
-    # Email addresses
-    emails = re.findall(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b", text)
-    if emails:
-        entities["emails"] = list(set(emails))[:5]
-
-    # URLs
-    urls = re.findall(r'https?://[^\s<>"{}|\\^`\[\]]+', text)
-    if urls:
-        entities["urls"] = list(set(urls))[:5]
-
-    # Phone numbers (various formats)
-    phones = re.findall(r"\b(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b", text)
-    if phones:
-        entities["phones"] = list(set(phones))[:3]
-
-    # Dates (common formats)
-    dates = re.findall(
-        r"\b(?:\d{1,2}[-/]\d{1,2}[-/]\d{2,4}|\d{4}[-/]\d{1,2}[-/]\d{1,2}|"
-        r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{1,2},?\s+\d{4})\b",
-        text,
-        re.IGNORECASE,
-    )
-    if dates:
-        entities["dates"] = list(set(dates))[:5]
+    # One pass over the text; dicts dedupe while keeping first-seen order
+    found: Dict[str, Dict[str, None]] = {kind: {} for kind in _ENTITY_LIMITS}
+    for match in _ENTITY_RE.finditer(text):
+        found[match.lastgroup][match.group()] = None
 
-    # Money amounts
-    amounts = re.findall(
-        r"\$[\d,]+(?:\.\d{2})?|\b\d+(?:,\d{3})*(?:\.\d{2})?\s*(?:USD|EUR|GBP)\b", text
-    )
-    if amounts:
-        entities["amounts"] = list(set(amounts))[:5]
+    for kind, limit in _ENTITY_LIMITS.items():
+        if found[kind]:
+            entities[kind] = list(found[kind])[:limit]
 
     return entities
 
@@ -970,6 +1317,7 @@ def capture_and_ocr(config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         return None
 
     engine = config.get("engine", "auto")
+    tess_options = tesseract_options(config)
     all_text = []
 
     # Check if we should capture all monitors
@@ -981,47 +1329,87 @@ def capture_and_ocr(config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
             if image:
                 images = [image]
 
-        # OCR each monitor and clean up images
-        for i, image in enumerate(images):
-            try:
-                text = ocr_image(image, engine=engine)
-                if text:
-                    all_text.append(text)
-                    logger.debug(f"OCR monitor {i + 1}: {len(text)} chars")
-            finally:
-                # Clean up image to prevent memory leak
-                try:
-                    image.close()
-                except Exception:
-                    pass
-        del images
+        # OCR each monitor, in parallel when there are several
+        def ocr_monitor(image) -> str:
+            return _ocr_and_close(_prepare_for_ocr(image, config), engine, tess_options)
+
+        if len(images) > 1:
+            texts = list(_get_ocr_pool().map(ocr_monitor, images))
+        else:
+            texts = [ocr_monitor(image) for image in images]
+
+        for i, text in enumerate(texts):
+            if text:
+                all_text.append(text)
+                logger.debug(f"OCR monitor {i + 1}: {len(text)} chars")
     else:
-        # Capture monitor under mouse cursor (better for multi-monitor setups)
-        # This ensures we OCR the screen the user is actually looking at
-        image = capture_screen(window_only=False)
-        if image is None:
-            # Fallback to active window
-            image = capture_screen(window_only=True)
+        # Capture the active window (or monitor under cursor, per capture_region)
+        image = capture_for_ocr(config)
         if image is None:
             return None
 
-        try:
-            text = ocr_image(image, engine=engine)
-            if text:
-                all_text.append(text)
-        finally:
-            # Clean up image to prevent memory leak
-            try:
-                image.close()
-            except Exception:
-                pass
-            del image
+        text = _ocr_and_close(image, engine, tess_options)
+        if text:
+            all_text.append(text)
 
     if not all_text:
         return None
 
     # Combine text from all sources
-    combined_text = "\n\n".join(all_text)
+    result = extract_text_data("\n\n".join(all_text), config)
+
+    # Add monitor count info if multi-monitor
+    if result is not None and config.get("capture_all_monitors", False):
+        result["monitors_captured"] = len(all_text)
+
+    return result
+
+
+def _ocr_and_close(image, engine: str, tess_options: str) -> str:
+    """OCR an image, then close it to prevent a memory leak."""
+    try:
+        return ocr_image(image, engine=engine, tesseract_config=tess_options)
+    finally:
+        try:
+            image.close()
+        except Exception:
+            pass
+
+
+# Worker threads for OCR of multiple monitors. The engines release the GIL
+# while recognizing (pytesseract waits on a subprocess), so monitors are
+# OCRed concurrently; shared tesserocr and RapidOCR engines are not reloaded
+# per worker as they would be in a process pool.
+_ocr_pool: Optional[ThreadPoolExecutor] = None
+_ocr_pool_lock = threading.Lock()
+
+
+def _get_ocr_pool() -> ThreadPoolExecutor:
+    """Get the shared multi-monitor OCR thread pool, creating it on first use."""
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is None:
+            _ocr_pool = ThreadPoolExecutor(
+                max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="ocr"
+            )
+        return _ocr_pool
+
+
+def extract_text_data(text: str, config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Extract keywords, entities and text from OCR output.
+
+    Args:
+        text: OCR text
+        config: OCR configuration dict
+            - extract_mode: str - keywords, entities, or full_text
+            - max_keywords: int - Maximum keywords to extract
+
+    Returns:
+        Dict with 'keywords', 'entities', and optionally 'text', or None if no text
+    """
+    if not text:
+        return None
 
     result: Dict[str, Any] = {}
 
@@ -1030,18 +1418,14 @@ def capture_and_ocr(config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     max_keywords = config.get("max_keywords", 20)
 
     if extract_mode in ("keywords", "full_text"):
-        result["keywords"] = extract_keywords(combined_text, max_keywords)
+        result["keywords"] = extract_keywords(text, max_keywords)
 
     if extract_mode in ("entities", "full_text"):
-        result["entities"] = extract_entities(combined_text)
+        result["entities"] = extract_entities(text)
 
     if extract_mode == "full_text":
         # Truncate for storage
-        result["text"] = combined_text[:2000]
-
-    # Add monitor count info if multi-monitor
-    if config.get("capture_all_monitors", False):
-        result["monitors_captured"] = len(all_text)
+        result["text"] = text[:2000]
 
     return result
 
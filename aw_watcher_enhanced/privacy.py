@@ -9,10 +9,21 @@ Applies privacy rules to captured data:
 
 import logging
 import re
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Pattern, Tuple
 
 logger = logging.getLogger(__name__)
 
+# PII patterns for redact_pii, combined so the text is scanned once. Where
+# matches could overlap, earlier alternatives win (phone before SSN).
+_PII_RE = re.compile(
+    r"(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)"
+    r"|(?P<phone>\b(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b)"
+    r"|(?P<ssn>\b\d{3}[-.\s]?\d{2}[-.\s]?\d{4}\b)"
+    r"|(?P<cc>\b(?:\d{4}[-.\s]?){3}\d{4}\b)"
+)
+_PII_TAGS = {"email": "[EMAIL]", "phone": "[PHONE]", "ssn": "[SSN]", "cc": "[CREDIT_CARD]"}
+
 
 def apply_privacy_filters(
     data: Dict[str, Any], privacy_config: Dict[str, Any]
@@ -30,64 +41,88 @@ def apply_privacy_filters(
     if not data:
         return None
 
+    # The caller's dict is copied at most once, on the first change
+    copied = False
+
+    def writable() -> Dict[str, Any]:
+        nonlocal data, copied
+        if not copied:
+            data = data.copy()
+            copied = True
+        return data
+
     app = data.get("app", "").lower()
     title = data.get("title", "")
 
-    # Check app exclusions
+    # Check app exclusions (an excluded name within the app name, or vice versa)
     exclude_apps = privacy_config.get("exclude_apps", [])
-    for excluded in exclude_apps:
-        if excluded.lower() in app or app in excluded.lower():
+    if exclude_apps:
+        names, name_parts = _exclude_app_names(tuple(exclude_apps))
+        if app in name_parts or any(name in app for name in names):
             logger.debug(f"Excluding app: {app}")
             return None
 
     # Check title exclusions
-    exclude_titles = privacy_config.get("exclude_titles", [])
-    for pattern in exclude_titles:
-        try:
-            if re.search(pattern, title, re.IGNORECASE):
-                logger.debug(f"Excluding title matching: {pattern}")
+    exclude_titles_re = privacy_config.get("_exclude_titles_re")
+    if exclude_titles_re is not None:
+        # Combined pattern compiled at config load
+        if exclude_titles_re.search(title):
+            logger.debug("Excluding title matching an exclude pattern")
+            writable()["title"] = "[REDACTED]"
+    else:
+        exclude_titles = privacy_config.get("exclude_titles", [])
+        for pattern in _compile_patterns(tuple(exclude_titles)):
+            if pattern.search(title):
+                logger.debug(f"Excluding title matching: {pattern.pattern}")
                 # Option 1: Exclude entirely
                 # return None
                 # Option 2: Redact title but keep event
-                data = data.copy()
-                data["title"] = "[REDACTED]"
+                writable()["title"] = "[REDACTED]"
                 break
-        except re.error as e:
-            logger.warning(f"Invalid exclude pattern '{pattern}': {e}")
 
     # Check URL exclusions (if URL present)
     url = data.get("url", "")
     if url:
-        exclude_urls = privacy_config.get("exclude_urls", [])
-        for pattern in exclude_urls:
-            try:
-                if re.search(pattern, url, re.IGNORECASE):
-                    logger.debug(f"Excluding URL matching: {pattern}")
-                    data = data.copy()
-                    data["url"] = "[REDACTED]"
-                    data["domain"] = "[REDACTED]"
+        exclude_urls_re = privacy_config.get("_exclude_urls_re")
+        if exclude_urls_re is not None:
+            if exclude_urls_re.search(url):
+                logger.debug("Excluding URL matching an exclude pattern")
+                writable().update(url="[REDACTED]", domain="[REDACTED]")
+        else:
+            exclude_urls = privacy_config.get("exclude_urls", [])
+            for pattern in _compile_patterns(tuple(exclude_urls)):
+                if pattern.search(url):
+                    logger.debug(f"Excluding URL matching: {pattern.pattern}")
+                    writable().update(url="[REDACTED]", domain="[REDACTED]")
                     break
-            except re.error as e:
-                logger.warning(f"Invalid URL exclude pattern '{pattern}': {e}")
 
     # Apply redaction patterns to OCR content
     if "ocr_keywords" in data:
-        redact_patterns = privacy_config.get("redact_patterns", [])
-        data = data.copy()
-        data["ocr_keywords"] = _filter_keywords(data["ocr_keywords"], redact_patterns)
+        keywords = data["ocr_keywords"]
+        redact_re = privacy_config.get("_redact_re")
+        if redact_re is not None:
+            # Combined pattern compiled at config load
+            filtered = [k for k in keywords if not redact_re.search(k)]
+        else:
+            redact_patterns = privacy_config.get("redact_patterns", [])
+            filtered = _filter_keywords(keywords, redact_patterns)
+        if len(filtered) != len(keywords):
+            writable()["ocr_keywords"] = filtered
 
     if "ocr_entities" in data:
-        # Remove potentially sensitive entities
-        data = data.copy()
-        entities = data["ocr_entities"].copy()
-
-        # Optionally redact emails, phones, etc.
+        # Optionally remove potentially sensitive entities (emails, phones)
+        redacted = []
         if privacy_config.get("redact_emails", False):
-            entities.pop("emails", None)
+            redacted.append("emails")
         if privacy_config.get("redact_phones", False):
-            entities.pop("phones", None)
+            redacted.append("phones")
 
-        data["ocr_entities"] = entities
+        entities = data["ocr_entities"]
+        if any(key in entities for key in redacted):
+            entities = entities.copy()
+            for key in redacted:
+                entities.pop(key, None)
+            writable()["ocr_entities"] = entities
 
     return data
 
@@ -97,21 +132,40 @@ def _filter_keywords(keywords: List[str], redact_patterns: List[str]) -> List[st
     if not redact_patterns:
         return keywords
 
-    filtered = []
-    for keyword in keywords:
-        exclude = False
-        for pattern in redact_patterns:
-            try:
-                if re.search(pattern, keyword, re.IGNORECASE):
-                    exclude = True
-                    break
-            except re.error:
-                pass
+    patterns = _compile_patterns(tuple(redact_patterns))
+    return [k for k in keywords if not any(p.search(k) for p in patterns)]
 
-        if not exclude:
-            filtered.append(keyword)
 
-    return filtered
+@lru_cache(maxsize=32)
+def _exclude_app_names(exclude_apps: Tuple[str, ...]) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+    """
+    Lowercase excluded app names, once per distinct list.
+
+    Also returns every substring of the names, so checking whether an app
+    name is contained in any of them is a single set lookup.
+    """
+    names = tuple(name.lower() for name in exclude_apps)
+    parts = {""}
+    for name in names:
+        parts.update(name[i:j] for i in range(len(name)) for j in range(i + 1, len(name) + 1))
+    return names, frozenset(parts)
+
+
+@lru_cache(maxsize=32)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Tuple[Pattern[str], ...]:
+    """
+    Compile case-insensitive patterns, once per distinct list.
+
+    Used when a config hasn't been through compile_privacy_patterns. Invalid
+    patterns are logged and dropped.
+    """
+    compiled = []
+    for pattern in patterns:
+        try:
+            compiled.append(re.compile(pattern, re.IGNORECASE))
+        except (re.error, TypeError) as e:
+            logger.warning(f"Invalid privacy pattern '{pattern}': {e}")
+    return tuple(compiled)
 
 
 def redact_pii(text: str) -> str:
@@ -124,23 +178,7 @@ def redact_pii(text: str) -> str:
     - Social Security Numbers
     - Credit card numbers
     """
-    # Email addresses
-    text = re.sub(
-        r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b", "[EMAIL]", text
-    )
-
-    # Phone numbers
-    text = re.sub(
-        r"\b(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b", "[PHONE]", text
-    )
-
-    # SSN
-    text = re.sub(r"\b\d{3}[-.\s]?\d{2}[-.\s]?\d{4}\b", "[SSN]", text)
-
-    # Credit card (basic pattern)
-    text = re.sub(r"\b(?:\d{4}[-.\s]?){3}\d{4}\b", "[CREDIT_CARD]", text)
-
-    return text
+    return _PII_RE.sub(lambda m: _PII_TAGS[m.lastgroup], text)
 
 
 # Sensitive app patterns that should always be excluded
@@ -153,12 +191,12 @@ SENSITIVE_APPS = [
     r"enpass",
     r"roboform",
 ]
+_SENSITIVE_APPS_RE = re.compile("|".join(SENSITIVE_APPS))
 
 
 def is_sensitive_app(app: str) -> bool:
     """Check if an app should always be treated as sensitive."""
-    app_lower = app.lower()
-    return any(re.search(pattern, app_lower) for pattern in SENSITIVE_APPS)
+    return _SENSITIVE_APPS_RE.search(app.lower()) is not None
 
 
 # Test module
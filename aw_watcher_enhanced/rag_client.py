@@ -11,16 +11,130 @@ The Qdrant database is expected to be running at:
     http://localhost:6333
 """
 
+import json
 import logging
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional: faster JSON for Qdrant requests and responses
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional: Aho-Corasick automaton for client term matching
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+if ORJSON_AVAILABLE:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+# Project code pattern: P followed by YYYYMM-NNN
+_PROJECT_CODE_RE = re.compile(r"\b(P\d{6}-\d{3})\b", re.IGNORECASE)
+
+
+def _build_domain_trie(domain_map: Dict[str, str]) -> Dict[Optional[str], Any]:
+    """
+    Build a trie of domain labels, last label first, from a domain -> client map.
+
+    A node's None key holds the client code of the domain ending there, so
+    walking a query domain's labels from the right finds its longest mapped
+    suffix (e.g. "mail.client.co.uk" -> "client.co.uk").
+    """
+    trie: Dict[Optional[str], Any] = {}
+    for domain, client_code in domain_map.items():
+        node = trie
+        for label in reversed(domain.split(".")):
+            node = node.setdefault(label, {})
+        node[None] = client_code
+    return trie
+
+
+# A client text term is (token, length, client_code, matched_term, max
+# confidence, score divisor): token is the lowercased text searched for
+ClientTerm = Tuple[str, int, str, str, float, float]
+
+
+def _build_client_terms(client_index: Dict[str, Dict]) -> List[ClientTerm]:
+    """
+    Build the terms detect_client_from_text looks for, in the order it ranks ties.
+
+    Each client contributes its code, its domain (without "www.") and the
+    "|"-separated parts of its embedding text longer than 3 characters.
+    """
+    terms: List[ClientTerm] = []
+    for client_code, client_data in client_index.items():
+        if not isinstance(client_data, dict):
+            continue
+
+        # Client code itself (high confidence)
+        terms.append((client_code.lower(), len(client_code), client_code, client_code, 1.0, 10.0))
+
+        domain = client_data.get("domain", "")
+        if domain:
+            clean_domain = domain.lower().replace("www.", "")
+            terms.append((clean_domain, len(clean_domain), client_code, domain, 1.0, 5.0))
+
+        # Meaningful parts of the embedding text as additional keywords
+        embedding_text = client_data.get("embedding_text", "").lower()
+        for part in (p.strip() for p in embedding_text.split("|")):
+            if len(part) > 3:
+                terms.append((part, len(part), client_code, part, 0.8, 10.0))
+
+    # Empty terms would score 0 and can never be the best match
+    return [term for term in terms if term[1]]
+
+
+# A client search row is (client_code, lowercased code, lowercased searchable
+# text, display name)
+ClientSearchRow = Tuple[str, str, str, str]
+
+
+def _build_search_rows(client_index: Dict[str, Dict]) -> List[ClientSearchRow]:
+    """Precompute the lowercased text search_clients matches each client against."""
+    rows: List[ClientSearchRow] = []
+    for client_code, client_data in client_index.items():
+        if not isinstance(client_data, dict):
+            continue
+
+        # Code, name, domain and embedding text
+        searchable = " ".join(
+            [
+                client_code,
+                client_data.get("name") or "",
+                client_data.get("domain") or "",
+                client_data.get("embedding_text") or "",
+            ]
+        ).lower()
+        # As get_client_display_name, which looks codes up uppercased
+        info = client_index.get(client_code.upper())
+        display_name = (info.get("name") if info else None) or client_code
+        rows.append((client_code, client_code.lower(), searchable, display_name))
+    return rows
+
 
 class QdrantClient:
     """
@@ -43,6 +157,21 @@ class QdrantClient:
         self._session = requests.Session()
         self._session.headers.update({"Content-Type": "application/json"})
 
+        # Keep-alive pool, retrying transient gateway errors. Every request is a
+        # read (scroll and search are POSTs only to carry a body), so all can be
+        # retried; connection errors aren't, so a missing server fails fast.
+        retry = Retry(
+            total=3,
+            connect=0,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET", "POST"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
     def health_check(self) -> bool:
         """Check if Qdrant is reachable."""
         try:
@@ -56,7 +185,7 @@ class QdrantClient:
         try:
             response = self._session.get(f"{self.base_url}/collections", timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 return [c["name"] for c in data.get("result", {}).get("collections", [])]
         except Exception as e:
             logger.error(f"Error listing collections: {e}")
@@ -82,10 +211,12 @@ class QdrantClient:
                 payload["offset"] = offset
 
             response = self._session.post(
-                f"{self.base_url}/collections/{collection}/points/scroll", json=payload, timeout=30
+                f"{self.base_url}/collections/{collection}/points/scroll",
+                data=_json_dumps(payload),
+                timeout=30,
             )
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 result = data.get("result", {})
                 points = result.get("points", [])
                 next_offset = result.get("next_page_offset")
@@ -123,29 +254,70 @@ class QdrantClient:
                 payload["filter"] = filter_conditions
 
             response = self._session.post(
-                f"{self.base_url}/collections/{collection}/points/search", json=payload, timeout=30
+                f"{self.base_url}/collections/{collection}/points/search",
+                data=_json_dumps(payload),
+                timeout=30,
             )
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 return data.get("result", [])
         except Exception as e:
             logger.error(f"Error searching collection {collection}: {e}")
         return []
 
+    def batch_search(self, collection: str, queries: List[Dict]) -> List[List[Dict]]:
+        """
+        Run several vector similarity searches in one request.
+
+        Args:
+            collection: Collection name
+            queries: Search requests, each with "vector" and "limit" and
+                optionally "score_threshold" and "filter" (as for search())
+
+        Returns:
+            List of search results for each query, in order
+        """
+        if not queries:
+            return []
+
+        try:
+            searches = [{"with_payload": True, **query} for query in queries]
+            response = self._session.post(
+                f"{self.base_url}/collections/{collection}/points/search/batch",
+                data=_json_dumps({"searches": searches}),
+                timeout=30,
+            )
+            if response.status_code == 200:
+                results = _json_loads(response.content).get("result", [])
+                if len(results) == len(queries):
+                    return results
+                logger.error(
+                    f"Batch search of {collection} returned {len(results)} results "
+                    f"for {len(queries)} queries"
+                )
+        except Exception as e:
+            logger.error(f"Error batch searching collection {collection}: {e}")
+        return [[] for _ in queries]
+
     def get_all_points(self, collection: str) -> List[Dict]:
         """Get all points from a collection by scrolling."""
-        all_points = []
-        offset = None
-
-        while True:
-            points, next_offset = self.scroll(collection, limit=100, offset=offset)
-            all_points.extend(points)
+        return list(self.iter_points(collection))
 
-            if not next_offset or not points:
-                break
-            offset = next_offset
+    def iter_points(self, collection: str, page_size: int = 1000) -> Iterator[Dict]:
+        """
+        Yield all points from a collection, scrolling page by page.
 
-        return all_points
+        The next page is requested as soon as the current one arrives, so its
+        round trip overlaps with the caller processing the current page.
+        """
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="qdrant-scroll") as executor:
+            future = executor.submit(self.scroll, collection, page_size)
+            while future is not None:
+                points, next_offset = future.result()
+                future = None
+                if next_offset and points:
+                    future = executor.submit(self.scroll, collection, page_size, next_offset)
+                yield from points
 
 
 class RAGClient:
@@ -172,7 +344,14 @@ class RAGClient:
         # Cache storage
         self._client_index: Optional[Dict[str, Dict]] = None
         self._domain_map: Optional[Dict[str, str]] = None
+        self._domain_trie: Dict[Optional[str], Any] = {}
+        self._client_terms: List[ClientTerm] = []
+        self._term_automaton = None
+        self._term_scan_order: List[int] = []
+        self._search_rows: List[ClientSearchRow] = []
         self._last_load: Optional[datetime] = None
+        # time.monotonic() after which the cache is stale
+        self._reload_deadline = 0.0
         self._connected: bool = False
 
         # Check connection
@@ -184,9 +363,7 @@ class RAGClient:
 
     def _should_reload(self) -> bool:
         """Check if cache should be reloaded."""
-        if self._client_index is None or self._last_load is None:
-            return True
-        return datetime.now() - self._last_load > self.cache_ttl
+        return self._client_index is None or time.monotonic() >= self._reload_deadline
 
     def _load_data(self) -> bool:
         """Load client data from Qdrant into memory cache."""
@@ -195,12 +372,10 @@ class RAGClient:
 
         try:
             # Load all clients from the 'clients' collection
-            points = self.qdrant.get_all_points("clients")
-
             self._client_index = {}
             self._domain_map = {}
 
-            for point in points:
+            for point in self.qdrant.iter_points("clients"):
                 payload = point.get("payload", {})
                 client_code = payload.get("code")
 
@@ -212,7 +387,8 @@ class RAGClient:
 
                 # Clean domain (remove www. prefix)
                 if domain:
-                    clean_domain = domain.lower().strip()
+                    domain_lower = domain.lower()
+                    clean_domain = domain_lower.strip()
                     if clean_domain.startswith("www."):
                         clean_domain = clean_domain[4:]
 
@@ -220,8 +396,8 @@ class RAGClient:
                     self._domain_map[clean_domain] = client_code
 
                     # Also add the full domain with www if present
-                    if domain.lower().startswith("www."):
-                        self._domain_map[domain.lower()] = client_code
+                    if domain_lower.startswith("www."):
+                        self._domain_map[domain_lower] = client_code
 
                 # Store client info
                 self._client_index[client_code] = {
@@ -236,7 +412,11 @@ class RAGClient:
                     "embedding_text": payload.get("embedding_text", ""),
                 }
 
+            self._domain_trie = _build_domain_trie(self._domain_map)
+            self._build_term_index()
+            self._search_rows = _build_search_rows(self._client_index)
             self._last_load = datetime.now()
+            self._reload_deadline = time.monotonic() + self.cache_ttl.total_seconds()
             logger.info(f"Loaded {len(self._client_index)} clients from Qdrant")
             logger.info(f"Built {len(self._domain_map)} domain mappings")
             return True
@@ -245,6 +425,35 @@ class RAGClient:
             logger.error(f"Error loading data from Qdrant: {e}")
             return False
 
+    def _build_term_index(self):
+        """
+        Rebuild the client terms for detect_client_from_text.
+
+        With pyahocorasick installed they're also compiled into one automaton
+        mapping each token to the indices of the terms that use it, so a single
+        pass over the text finds every term present, however many clients
+        there are. Otherwise they're ordered for scanning, longest first.
+        """
+        self._client_terms = _build_client_terms(self._client_index or {})
+        self._term_automaton = None
+        self._term_scan_order = []
+        if not AHOCORASICK_AVAILABLE:
+            terms = self._client_terms
+            self._term_scan_order = sorted(range(len(terms)), key=lambda i: (-terms[i][1], i))
+            return
+        if not self._client_terms:
+            return
+
+        automaton = ahocorasick.Automaton()
+        for index, term in enumerate(self._client_terms):
+            token = term[0]
+            if token in automaton:
+                automaton.get(token).append(index)
+            else:
+                automaton.add_word(token, [index])
+        automaton.make_automaton()
+        self._term_automaton = automaton
+
     def _ensure_loaded(self):
         """Ensure data is loaded and fresh."""
         if self._should_reload():
@@ -286,22 +495,22 @@ class RAGClient:
         if domain.startswith("www."):
             domain = domain[4:]
 
-        # Direct lookup
-        client_code = self.domain_map.get(domain)
+        # Longest mapped suffix: the domain itself, else its nearest parent
+        # domain. A bare TLD only matches as the whole domain.
+        self._ensure_loaded()
+        labels = domain.split(".")
+        node = self._domain_trie
+        client_code = None
+        for depth, label in enumerate(reversed(labels), 1):
+            node = node.get(label)
+            if node is None:
+                break
+            if depth > 1 or depth == len(labels):
+                client_code = node.get(None, client_code)
+
         if client_code:
             logger.debug(f"Domain '{domain}' matched to client '{client_code}'")
-            return client_code
-
-        # Try without subdomains
-        parts = domain.split(".")
-        if len(parts) > 2:
-            base_domain = ".".join(parts[-2:])
-            client_code = self.domain_map.get(base_domain)
-            if client_code:
-                logger.debug(f"Base domain '{base_domain}' matched to client '{client_code}'")
-                return client_code
-
-        return None
+        return client_code
 
     def detect_client_from_email(self, email: str) -> Optional[str]:
         """
@@ -332,44 +541,32 @@ class RAGClient:
         if not text:
             return None
 
+        self._ensure_loaded()
         text_lower = text.lower()
-        best_match = None
-        best_score = 0.0
-
-        for client_code, client_data in self.client_index.items():
-            if not isinstance(client_data, dict):
-                continue
-
-            # Check client code itself (high confidence)
-            if client_code.lower() in text_lower:
-                score = len(client_code) / max(len(text_lower), 1) * 100
-                if score > best_score:
-                    best_match = (client_code, client_code, min(1.0, score / 10))
-                    best_score = score
-
-            # Check domain
-            domain = client_data.get("domain", "")
-            if domain:
-                clean_domain = domain.lower().replace("www.", "")
-                if clean_domain in text_lower:
-                    score = len(clean_domain) / max(len(text_lower), 1) * 100
-                    if score > best_score:
-                        best_match = (client_code, domain, min(1.0, score / 5))
-                        best_score = score
-
-            # Check embedding text for additional keywords
-            embedding_text = client_data.get("embedding_text", "").lower()
-            if embedding_text:
-                # Extract meaningful parts from embedding text
-                parts = [p.strip() for p in embedding_text.split("|")]
-                for part in parts:
-                    if part and len(part) > 3 and part in text_lower:
-                        score = len(part) / max(len(text_lower), 1) * 100
-                        if score > best_score:
-                            best_match = (client_code, part, min(0.8, score / 10))
-                            best_score = score
-
-        return best_match
+
+        # The longest term contained in the text wins, then the first built
+        terms = self._client_terms
+        if self._term_automaton is not None:
+            found = {i for _, indices in self._term_automaton.iter(text_lower) for i in indices}
+            best = min(found, key=lambda i: (-terms[i][1], i)) if found else None
+        else:
+            # Terms in ranking order, so the first one contained in the text
+            # wins; terms longer than the text can't be in it
+            text_len = len(text_lower)
+            best = next(
+                (
+                    i
+                    for i in self._term_scan_order
+                    if len(terms[i][0]) <= text_len and terms[i][0] in text_lower
+                ),
+                None,
+            )
+        if best is None:
+            return None
+
+        _, length, client_code, matched_term, max_confidence, divisor = self._client_terms[best]
+        score = length / max(len(text_lower), 1) * 100
+        return (client_code, matched_term, min(max_confidence, score / divisor))
 
     def detect_project_code(self, text: str) -> Optional[str]:
         """
@@ -384,9 +581,7 @@ class RAGClient:
         if not text:
             return None
 
-        # Project code pattern: P followed by YYYYMM-NNN
-        pattern = r"\b(P\d{6}-\d{3})\b"
-        match = re.search(pattern, text, re.IGNORECASE)
+        match = _PROJECT_CODE_RE.search(text)
         if match:
             return match.group(1).upper()
 
@@ -433,33 +628,20 @@ class RAGClient:
         if not query:
             return []
 
+        self._ensure_loaded()
         query_lower = query.lower()
         results = []
 
-        for client_code, client_data in self.client_index.items():
-            if not isinstance(client_data, dict):
-                continue
-
-            # Check code, name, domain, embedding_text
-            searchable = " ".join(
-                [
-                    client_code,
-                    client_data.get("name", ""),
-                    client_data.get("domain", ""),
-                    client_data.get("embedding_text", ""),
-                ]
-            ).lower()
-
+        for client_code, code_lower, searchable, display_name in self._search_rows:
             if query_lower in searchable:
                 # Higher score for exact code match
-                if query_lower == client_code.lower():
+                if query_lower == code_lower:
                     score = 1.0
-                elif query_lower in client_code.lower():
+                elif query_lower in code_lower:
                     score = 0.9
                 else:
                     score = 0.5
 
-                display_name = self.get_client_display_name(client_code)
                 results.append((client_code, display_name, score))
 
         # Sort by score descending
@@ -486,6 +668,7 @@ class RAGClient:
     def refresh(self) -> bool:
         """Force refresh the cache from Qdrant."""
         self._last_load = None
+        self._reload_deadline = 0.0
         return self._load_data()
 
 
@@ -6,20 +6,33 @@ Features:
 - Idle detection (mouse/keyboard inactivity)
 - Smart throttling (adjust polling based on activity)
 - OCR diff detection (skip LLM if content unchanged)
+- Screen change detection (skip OCR if the screenshot is unchanged)
+- Persistent LLM result cache (skip LLM for screens seen before)
 - Efficient resource usage
 """
 
 import hashlib
+import json
 import logging
 import queue
 import re
+import sqlite3
 import sys
 import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from difflib import SequenceMatcher
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+# Optional: rapidfuzz for fast text similarity (falls back to difflib)
+try:
+    from rapidfuzz import fuzz
+
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +75,7 @@ class OCRDiffDetector:
 
         self._history: List[Tuple[str, str, float]] = []  # (hash, text, timestamp)
         self._last_text: Optional[str] = None
+        self._last_normalized: Optional[str] = None
         self._last_hash: Optional[str] = None
         self._last_keywords: set = set()
 
@@ -87,7 +101,10 @@ class OCRDiffDetector:
 
     def _hash_text(self, text: str) -> str:
         """Create hash of normalized text."""
-        normalized = self._normalize_text(text)
+        return self._hash_normalized(self._normalize_text(text))
+
+    def _hash_normalized(self, normalized: str) -> str:
+        """Create hash of already normalized text."""
         return hashlib.md5(normalized.encode()).hexdigest()
 
     def _extract_keywords(self, text: str) -> set:
@@ -139,10 +156,14 @@ class OCRDiffDetector:
         if not text1 or not text2:
             return 0.0
 
-        norm1 = self._normalize_text(text1)
-        norm2 = self._normalize_text(text2)
+        return self._normalized_similarity(self._normalize_text(text1), self._normalize_text(text2))
+
+    def _normalized_similarity(self, norm1: str, norm2: str) -> float:
+        """Calculate similarity ratio between two normalized texts."""
+        if RAPIDFUZZ_AVAILABLE:
+            # Bit-parallel Indel ratio in C++, same scale as SequenceMatcher.ratio()
+            return fuzz.ratio(norm1, norm2) / 100.0
 
-        # Use SequenceMatcher for efficient similarity calculation
         return SequenceMatcher(None, norm1, norm2).ratio()
 
     def should_run_llm(self, ocr_text: str, window_data: Optional[Dict] = None) -> Tuple[bool, str]:
@@ -161,7 +182,9 @@ class OCRDiffDetector:
         if not ocr_text:
             return False, "empty_ocr"
 
-        current_hash = self._hash_text(ocr_text)
+        # Normalize once for both the hash and the similarity checks
+        normalized = self._normalize_text(ocr_text)
+        current_hash = self._hash_normalized(normalized)
 
         # First check: identical hash (fastest)
         if current_hash == self._last_hash:
@@ -171,7 +194,7 @@ class OCRDiffDetector:
 
         # Second check: similarity ratio
         if self._last_text:
-            similarity = self._get_similarity(ocr_text, self._last_text)
+            similarity = self._normalized_similarity(normalized, self._last_normalized)
 
             if similarity >= self.similarity_threshold:
                 # Check if character difference is meaningful
@@ -201,6 +224,7 @@ class OCRDiffDetector:
 
         # Update state
         self._last_text = ocr_text
+        self._last_normalized = normalized
         self._last_hash = current_hash
         self._last_keywords = current_keywords
 
@@ -217,6 +241,7 @@ class OCRDiffDetector:
         """Force LLM to run on next check (e.g., after window change)."""
         self._last_hash = None
         self._last_text = None
+        self._last_normalized = None
         self._last_keywords = set()
 
     def get_stats(self) -> Dict[str, Any]:
@@ -232,6 +257,185 @@ class OCRDiffDetector:
         }
 
 
+def screen_hash(image, hash_size: int = 8) -> int:
+    """
+    Perceptual difference hash (dHash) of a PIL image.
+
+    Shrinks the image to (hash_size + 1) x hash_size grayscale pixels and sets
+    one bit per pixel that is brighter than its right neighbour. Similar
+    screenshots give hashes a few bits apart.
+    """
+    from PIL import Image
+
+    # Shrink before converting so only a handful of pixels go through convert()
+    small = image.resize((hash_size + 1, hash_size), Image.Resampling.BOX, reducing_gap=2.0)
+    pixels = small.convert("L").tobytes()
+
+    value = 0
+    width = hash_size + 1
+    for row in range(0, len(pixels), width):
+        for col in range(row, row + hash_size):
+            value = (value << 1) | (pixels[col] > pixels[col + 1])
+    return value
+
+
+# int.bit_count() is Python 3.10+
+if hasattr(int, "bit_count"):
+    _bit_count = int.bit_count
+else:
+
+    def _bit_count(value: int) -> int:
+        return bin(value).count("1")
+
+
+def hamming_distance(hash1: int, hash2: int) -> int:
+    """Number of differing bits between two image hashes."""
+    return _bit_count(hash1 ^ hash2)
+
+
+class ScreenChangeDetector:
+    """
+    Detect unchanged screenshots to skip OCR and LLM entirely.
+
+    Hashing a capture takes about a millisecond, versus hundreds of
+    milliseconds to seconds for OCR plus an LLM call.
+    """
+
+    def __init__(self, max_distance: int = 5, hash_size: int = 8):
+        """
+        Args:
+            max_distance: Maximum differing hash bits to consider "same screen"
+            hash_size: Hash grid size (hash has hash_size^2 bits)
+        """
+        self.max_distance = max_distance
+        self.hash_size = hash_size
+        self._last_hash: Optional[int] = None
+
+        # Stats
+        self.stats = {
+            "total_checks": 0,
+            "skipped_unchanged": 0,
+        }
+
+    def is_unchanged(self, image) -> bool:
+        """Check whether image matches the previous capture, and remember it."""
+        self.stats["total_checks"] += 1
+        try:
+            current_hash = screen_hash(image, self.hash_size)
+        except Exception as e:
+            logger.debug(f"Screen hash failed: {e}")
+            self._last_hash = None
+            return False
+
+        last_hash = self._last_hash
+        self._last_hash = current_hash
+        if last_hash is None:
+            return False
+
+        distance = hamming_distance(current_hash, last_hash)
+        if distance <= self.max_distance:
+            self.stats["skipped_unchanged"] += 1
+            logger.debug(f"Screen unchanged (hash distance {distance}), skipping OCR")
+            return True
+        return False
+
+    @property
+    def last_hash(self) -> Optional[int]:
+        """Hash of the most recent capture, or None."""
+        return self._last_hash
+
+    def reset(self):
+        """Forget the previous capture (e.g., after window change)."""
+        self._last_hash = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get screen change detection statistics."""
+        return dict(self.stats)
+
+
+class LLMResultCache:
+    """
+    Persistent LLM results keyed by screen hash and window, in SQLite.
+
+    People cycle through the same windows all day, so many screens have been
+    summarized before, possibly in an earlier session.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_entries: int = 5000,
+        max_age: float = 7 * 86400.0,
+    ):
+        """
+        Args:
+            path: SQLite database file
+            max_entries: Maximum cached results (oldest are evicted)
+            max_age: Seconds before a cached result expires
+        """
+        self.max_entries = max_entries
+        self.max_age = max_age
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # Used from the OCR worker thread; access is serialized by the lock
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_results "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            self._conn.execute("DELETE FROM llm_results WHERE created < ?", (self._cutoff(),))
+
+        # Stats
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+        }
+
+    def _cutoff(self) -> float:
+        return time.time() - self.max_age
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached result, or None if missing or expired."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value FROM llm_results WHERE key = ? AND created >= ?",
+                    (key, self._cutoff()),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"LLM cache read failed: {e}")
+            return None
+
+        if row is None:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Dict[str, Any]):
+        """Store a result, evicting the oldest entries beyond max_entries."""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_results (key, value, created) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), time.time()),
+                )
+                self._conn.execute(
+                    "DELETE FROM llm_results WHERE key IN (SELECT key FROM llm_results "
+                    "ORDER BY created DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.debug(f"LLM cache write failed: {e}")
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
+
+
 class IdleDetector:
     """Detect user idle time (no mouse/keyboard activity)."""
 
@@ -307,9 +511,15 @@ class IdleDetector:
 class ProcessingQueue:
     """Async queue for OCR/LLM processing."""
 
-    def __init__(self, processor: Callable, max_size: int = 10):
+    def __init__(
+        self,
+        processor: Callable,
+        max_size: int = 10,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
         self._queue: queue.Queue = queue.Queue(maxsize=max_size)
         self._processor = processor
+        self._on_result = on_result
         self._worker_thread: Optional[threading.Thread] = None
         self._running = False
         self._last_result: Optional[Dict[str, Any]] = None
@@ -371,6 +581,9 @@ class ProcessingQueue:
                     with self._result_lock:
                         self._last_result = result
 
+                    if self._on_result is not None:
+                        self._on_result(result)
+
                 except Exception as e:
                     logger.error(f"Error processing task: {e}")
                 finally:
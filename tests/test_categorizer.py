@@ -4,12 +4,18 @@ Tests for activity categorization.
 
 import pytest
 
+from aw_watcher_enhanced import categorizer
 from aw_watcher_enhanced.categorizer import (
     DEFAULT_RULES,
     _detect_client,
+    _detect_client_and_project,
+    _get_rag_client,
     _match_rules,
     categorize_event,
+    clear_caches,
     get_category_hierarchy,
+    load_clients_from_yaml,
+    load_rules_from_yaml,
     suggest_category,
 )
 
@@ -209,6 +215,15 @@ class TestCategorizeEvent:
         result = categorize_event(data, config)
         assert result is None
 
+    def test_rule_on_missing_field(self):
+        """Test rules on fields the event doesn't have."""
+        rules = [
+            {"match": {"app": "browser", "url": "github"}, "category": "Work/Development"},
+            {"match": {"app": "browser", "url": "^$"}, "category": "Uncategorized/Browser"},
+        ]
+        data = {"app": "browser.exe", "title": "New Tab"}
+        assert _match_rules(data, rules) == "Uncategorized/Browser"
+
 
 class TestClientDetection:
     """Tests for client/project detection."""
@@ -264,6 +279,23 @@ class TestClientDetection:
         result = _detect_client({"title": "Something"}, {})
         assert result is None
 
+    def test_project_keyword_takes_priority(self):
+        """Test that project keywords win over client keywords found earlier in the text."""
+        yaml_clients = {
+            "acme-corp": {"keywords": ["acme"], "projects": {"website": ["redesign"]}},
+        }
+        data = {"title": "acme - redesign"}
+        result = _detect_client_and_project(data, yaml_clients, {})
+        assert result == ("acme-corp", "website")
+
+    def test_yaml_clients_before_config_keywords(self):
+        """Test that YAML clients are checked before config keywords."""
+        yaml_clients = {"acme-corp": {"domains": ["acme.com"]}}
+        config_keywords = {"bigcorp": ["portal"]}
+        data = {"title": "Portal", "domain": "acme.com"}
+        result = _detect_client_and_project(data, yaml_clients, config_keywords)
+        assert result == ("acme-corp", None)
+
     def test_client_in_categorize_event(self):
         """Test client detection through categorize_event."""
         config = {
@@ -279,6 +311,77 @@ class TestClientDetection:
         result = categorize_event(data, config)
         assert result == "Work/Client/acme-corp"
 
+    def test_repeat_event_with_different_config(self):
+        """Test that cached results aren't reused across configs."""
+        data = {"app": "unknown.exe", "title": "ACME Meeting Notes"}
+        config = {"enabled": True, "use_rag": False, "client_keywords": {"acme-corp": ["acme"]}}
+        assert categorize_event(data, config) == "Work/Client/acme-corp"
+        assert categorize_event(data, config) == "Work/Client/acme-corp"
+
+        other_config = {"enabled": True, "use_rag": False, "client_keywords": {}}
+        assert categorize_event(data, other_config) is None
+
+    def test_client_matcher_built_once(self, monkeypatch, tmp_path):
+        """Test that repeated events reuse one client matcher when no clients file exists."""
+        builds = []
+        original_init = categorizer.ClientMatcher.__init__
+
+        def counting_init(matcher, *args, **kwargs):
+            builds.append(1)
+            original_init(matcher, *args, **kwargs)
+
+        monkeypatch.setattr(categorizer.ClientMatcher, "__init__", counting_init)
+        clear_caches()
+        config = {
+            "enabled": True,
+            "use_rag": False,
+            "clients_file": tmp_path / "missing.yaml",
+            "client_keywords": {"acme-corp": ["acme"]},
+        }
+        for i in range(5):
+            data = {"app": "unknown.exe", "title": f"ACME Notes {i}"}
+            assert categorize_event(data, config) == "Work/Client/acme-corp"
+            assert _detect_client(data, config["client_keywords"]) == "acme-corp"
+        assert len(builds) == 1
+
+    def test_missing_clients_file_cached(self, tmp_path):
+        """Test that a missing clients file is looked up only once."""
+        clear_caches()
+        assert load_clients_from_yaml(tmp_path / "missing.yaml") == {}
+        (tmp_path / "missing.yaml").write_text("clients:\n  acme-corp: [acme]\n")
+        assert load_clients_from_yaml(tmp_path / "missing.yaml") == {}
+        clear_caches()
+        assert load_clients_from_yaml(tmp_path / "missing.yaml") == {"acme-corp": ["acme"]}
+        clear_caches()
+
+    def test_clear_caches_resets_rag_client(self):
+        """Test that clear_caches drops cached RAG client handles."""
+        clear_caches()
+        _get_rag_client("localhost", 6333)
+        assert _get_rag_client.cache_info().currsize == 1
+        clear_caches()
+        assert _get_rag_client.cache_info().currsize == 0
+
+
+class TestLoadRulesFromYaml:
+    """Tests for loading rules from YAML."""
+
+    def test_reload_reuses_unchanged_file(self, tmp_path):
+        """Test that reloading an unchanged file reuses the parsed rules."""
+        pytest.importorskip("yaml")
+        rules_file = tmp_path / "categories.yaml"
+        rules_file.write_text('rules:\n  - match: {app: "foo"}\n    category: "Foo"\n')
+
+        clear_caches()
+        rules = load_rules_from_yaml(rules_file)
+        clear_caches()
+        assert load_rules_from_yaml(rules_file) is rules
+
+        rules_file.write_text('rules:\n  - match: {app: "bar"}\n    category: "Barbaz"\n')
+        clear_caches()
+        assert load_rules_from_yaml(rules_file)[0]["category"] == "Barbaz"
+        clear_caches()
+
 
 class TestCategoryHierarchy:
     """Tests for get_category_hierarchy function."""
@@ -329,7 +432,6 @@ class TestSuggestCategory:
     def test_suggest_multiple(self):
         """Test that multiple suggestions are returned."""
         data = {"app": "chrome.exe", "url": "https://github.com/user/repo", "title": "Pull Request"}
-        }
         result = suggest_category(data)
         assert len(result) >= 1
 
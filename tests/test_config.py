@@ -11,6 +11,7 @@ import pytest
 
 from aw_watcher_enhanced.config import (
     DEFAULT_CONFIG,
+    compile_pattern_union,
     deep_merge,
     get_config_dir,
     load_config,
@@ -85,6 +86,30 @@ class TestDeepMerge:
         assert base == original_base
 
 
+class TestCompilePatternUnion:
+    """Tests for compile_pattern_union function."""
+
+    def test_matches_any_pattern(self):
+        """Test that the combined pattern matches any of the patterns."""
+        regex = compile_pattern_union([r".*bank.*", r"paypal"])
+        assert regex.search("My Bank Account")
+        assert regex.search("https://paypal.com")
+        assert not regex.search("https://github.com")
+
+    def test_empty_patterns(self):
+        """Test that no patterns gives None."""
+        assert compile_pattern_union([]) is None
+
+    def test_drops_invalid_patterns(self):
+        """Test that invalid patterns are dropped."""
+        regex = compile_pattern_union([r"[invalid", r"secret"])
+        assert regex.search("Top Secret")
+
+    def test_backreference_not_combined(self):
+        """Test that patterns with numbered backreferences aren't combined."""
+        assert compile_pattern_union([r"a", r"(b)\1"]) is None
+
+
 class TestDefaultConfig:
     """Tests for default configuration."""
 
@@ -171,6 +196,13 @@ class TestLoadConfig:
         result = load_config()
         assert result["watcher"]["poll_time"] == 5.0
         assert result["ocr"]["enabled"] is True
+
+    def test_compiles_privacy_patterns(self):
+        """Test that exclude patterns are compiled without touching the defaults."""
+        result = load_config()
+        assert result["privacy"]["_exclude_titles_re"].search("Change Password")
+        assert "_exclude_titles_re" not in DEFAULT_CONFIG["privacy"]
+
     @patch("aw_watcher_enhanced.config.get_config_dir")
     def test_loads_yaml_config(self, mock_config_dir):
         """Test loading YAML configuration file."""
@@ -249,6 +281,7 @@ watcher:
                 import yaml
 
                 import yaml
+
                 result = load_config()
                 # Should return defaults on error
                 assert result["watcher"]["poll_time"] == 5.0
@@ -6,6 +6,7 @@ import pytest
 
 from aw_watcher_enhanced.document import (
     _extract_project_from_path,
+    extract_git_info,
     parse_document_context,
 )
 
@@ -15,6 +16,7 @@ class TestParseDocumentContext:
 
     def test_vscode_with_project(self):
         """Test VS Code title parsing with project name."""
+        result = parse_document_context(
             app="Code.exe", title="main.py - my-project - Visual Studio Code"
         )
         assert result is not None
@@ -148,11 +150,24 @@ class TestParseDocumentContext:
     def test_file_extension_detection_markdown(self):
         """Test Markdown file extension detection."""
         result = parse_document_context(app="Code.exe", title="README.md - Visual Studio Code")
-        )
         assert result is not None
         assert result["file_type"] == "document"
         assert result["extension"] == ".md"
 
+    def test_file_extension_detection_uppercase(self):
+        """Test that extensions are detected case-insensitively."""
+        result = parse_document_context(app="Code.exe", title="REPORT.PDF - Visual Studio Code")
+        assert result is not None
+        assert result["file_type"] == "pdf"
+        assert result["extension"] == ".pdf"
+
+    def test_file_extension_detection_unknown(self):
+        """Test that unknown extensions are left out."""
+        result = parse_document_context(app="Code.exe", title="archive.tar.gz - Visual Studio Code")
+        assert result is not None
+        assert "file_type" not in result
+        assert "extension" not in result
+
 
 class TestExtractProjectFromPath:
     """Tests for _extract_project_from_path function."""
@@ -191,3 +206,33 @@ class TestExtractProjectFromPath:
         """Test with empty path."""
         result = _extract_project_from_path("")
         assert result is None
+
+
+class TestExtractGitInfo:
+    """Tests for extract_git_info function."""
+
+    def test_reads_branch_and_remote(self, tmp_path):
+        """Test reading branch and origin remote from the .git directory."""
+        git_dir = tmp_path / "my-repo" / ".git"
+        git_dir.mkdir(parents=True)
+        (git_dir / "HEAD").write_text("ref: refs/heads/feature/login\n")
+        (git_dir / "config").write_text(
+            '[core]\n\tbare = false\n[remote "origin"]\n\turl = git@github.com:user/my-repo.git\n'
+        )
+
+        result = extract_git_info(str(tmp_path / "my-repo" / "src" / "main.py"))
+        assert result == {
+            "repo": "my-repo",
+            "branch": "feature/login",
+            "remote": "git@github.com:user/my-repo.git",
+        }
+
+    def test_detached_head(self, tmp_path):
+        """Test that a detached HEAD is reported as HEAD."""
+        git_dir = tmp_path / "detached-repo" / ".git"
+        git_dir.mkdir(parents=True)
+        (git_dir / "HEAD").write_text("3f2a9c1d0e8b7a6f5e4d3c2b1a0f9e8d7c6b5a49\n")
+        (git_dir / "config").write_text("[core]\n\tbare = false\n")
+
+        result = extract_git_info(str(tmp_path / "detached-repo" / "main.py"))
+        assert result == {"repo": "detached-repo", "branch": "HEAD"}
@@ -4,11 +4,18 @@ Tests for OCR functionality.
 Note: These tests don't require actual OCR engine - they test the text processing functions.
 """
 
+import os
+from types import SimpleNamespace
+
 import pytest
 
+from aw_watcher_enhanced import ocr
 from aw_watcher_enhanced.ocr import (
+    _get_tesserocr_api,
     extract_entities,
     extract_keywords,
+    extract_text_data,
+    tesseract_options,
 )
 
 
@@ -207,6 +214,29 @@ class TestExtractEntities:
         assert len(result["emails"]) == 1
 
 
+class TestExtractTextData:
+    """Tests for extract_text_data function."""
+
+    def test_full_text_mode(self):
+        """Test full_text mode returns keywords, entities and text."""
+        text = "Quarterly budget review with finance@example.com"
+        result = extract_text_data(text, {"extract_mode": "full_text"})
+        assert "budget" in result["keywords"]
+        assert result["entities"]["emails"] == ["finance@example.com"]
+        assert result["text"] == text
+
+    def test_keywords_mode(self):
+        """Test keywords mode omits entities and text."""
+        result = extract_text_data("Quarterly budget review", {"extract_mode": "keywords"})
+        assert "budget" in result["keywords"]
+        assert "entities" not in result
+        assert "text" not in result
+
+    def test_empty_text(self):
+        """Test empty text returns None."""
+        assert extract_text_data("", {"extract_mode": "full_text"}) is None
+
+
 class TestOcrIntegration:
     """Integration tests for OCR module."""
 
@@ -266,3 +296,36 @@ class TestOcrIntegration:
         # Should extract entities
         assert "emails" in entities
         assert "amounts" in entities
+
+
+class TestTesseractOptions:
+    """Tests for tesseract_options function."""
+
+    def test_tessdata_dir_expands_home(self):
+        """Test that a ~ in tessdata_dir is expanded in the options."""
+        options = tesseract_options({"tessdata_dir": "~/tessdata_fast"})
+        expected = os.path.expanduser("~/tessdata_fast")
+        assert options == f'--oem 1 --psm 3 --tessdata-dir "{expected}"'
+        assert "~" not in options
+
+
+class TestTesserocrApi:
+    """Tests for the shared tesserocr API."""
+
+    def test_options_passed_as_ints(self, monkeypatch):
+        """Test that --oem and --psm reach PyTessBaseAPI as plain ints."""
+        created = []
+
+        def fake_api(**kwargs):
+            created.append(kwargs)
+            return SimpleNamespace(End=lambda: None)
+
+        monkeypatch.setattr(
+            ocr, "tesserocr", SimpleNamespace(PyTessBaseAPI=fake_api), raising=False
+        )
+        monkeypatch.setattr(ocr, "_tesserocr_api", None)
+        monkeypatch.setattr(ocr, "_tesserocr_options", None)
+
+        api = _get_tesserocr_api("--oem 1 --psm 3")
+        assert created == [{"oem": 1, "psm": 3}]
+        assert _get_tesserocr_api("--oem 1 --psm 3") is api
@@ -4,6 +4,7 @@ Tests for privacy filtering.
 
 import pytest
 
+from aw_watcher_enhanced.config import compile_privacy_patterns
 from aw_watcher_enhanced.privacy import (
     _filter_keywords,
     apply_privacy_filters,
@@ -66,6 +67,21 @@ class TestApplyPrivacyFilters:
         assert result["url"] == "[REDACTED]"
         assert result["domain"] == "[REDACTED]"
 
+    def test_compiled_exclude_patterns(self):
+        """Test exclusion with patterns compiled at config load."""
+        data = {
+            "app": "chrome.exe",
+            "title": "Secret Plans",
+            "url": "https://paypal.com/",
+            "domain": "paypal.com",
+        }
+        config = {"privacy": {"exclude_titles": [r".*secret.*"], "exclude_urls": [r".*paypal.*"]}}
+        compile_privacy_patterns(config)
+        assert config["privacy"]["_exclude_titles_re"] is not None
+        result = apply_privacy_filters(data, config["privacy"])
+        assert result["title"] == "[REDACTED]"
+        assert result["url"] == "[REDACTED]"
+
     def test_allow_normal_app(self):
         """Test that normal apps pass through."""
         data = {"app": "chrome.exe", "title": "GitHub"}
@@ -90,6 +106,15 @@ class TestApplyPrivacyFilters:
         assert "login" in result["ocr_keywords"]
         assert "submit" in result["ocr_keywords"]
 
+    def test_redact_keywords_compiled(self):
+        """Test OCR keyword filtering with the pattern compiled at config load."""
+        data = {"app": "chrome.exe", "title": "Page", "ocr_keywords": ["Password", "login"]}
+        config = {"privacy": {"redact_patterns": [r"password", r"username"]}}
+        compile_privacy_patterns(config)
+        assert config["privacy"]["_redact_re"] is not None
+        result = apply_privacy_filters(data, config["privacy"])
+        assert result["ocr_keywords"] == ["login"]
+
     def test_redact_emails_in_entities(self):
         """Test email redaction in OCR entities."""
         data = {
@@ -116,6 +141,27 @@ class TestApplyPrivacyFilters:
         assert "phones" not in result["ocr_entities"]
         assert "urls" in result["ocr_entities"]
 
+    def test_input_not_modified(self):
+        """Test that redaction leaves the caller's data untouched."""
+        data = {
+            "app": "chrome.exe",
+            "title": "My Bank",
+            "ocr_keywords": ["password", "login"],
+            "ocr_entities": {"emails": ["user@example.com"]},
+        }
+        config = {
+            "exclude_titles": [r"bank"],
+            "redact_patterns": [r"password"],
+            "redact_emails": True,
+        }
+        result = apply_privacy_filters(data, config)
+        assert result["title"] == "[REDACTED]"
+        assert result["ocr_keywords"] == ["login"]
+        assert result["ocr_entities"] == {}
+        assert data["title"] == "My Bank"
+        assert data["ocr_keywords"] == ["password", "login"]
+        assert data["ocr_entities"] == {"emails": ["user@example.com"]}
+
     def test_empty_data(self):
         """Test with empty data."""
         result = apply_privacy_filters({}, {})